@@ -0,0 +1,25 @@
+"""Snippet and file checks shared by the CI helper contract tests."""
+
+from __future__ import annotations
+
+import os
+import stat
+import unittest
+from pathlib import Path
+from typing import AnyStr
+
+
+def find_missing_snippets(text: AnyStr, snippets: tuple[AnyStr, ...]) -> list[AnyStr]:
+    # One C-level substring scan per snippet; measured faster than a combined
+    # regex alternation on the workflow and guide files these tests read.
+    return [snippet for snippet in snippets if snippet not in text]
+
+
+def assert_regular_file(test_case: unittest.TestCase, path: Path, label: str) -> os.stat_result:
+    # One stat call answers both "exists" and "is a regular file".
+    try:
+        file_stat = os.stat(path)
+    except FileNotFoundError:
+        test_case.fail(f"missing {label}: {path}")
+    test_case.assertTrue(stat.S_ISREG(file_stat.st_mode), msg=f"missing {label}: {path}")
+    return file_stat
@@ -0,0 +1,7 @@
+"""Shared filesystem anchors for CI helper scripts and their tests."""
+
+from pathlib import Path
+
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[1]
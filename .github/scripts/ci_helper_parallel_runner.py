@@ -5,6 +5,7 @@ from __future__ import annotations
 
 import argparse
 import concurrent.futures
+import os
 import subprocess
 import sys
 import time
@@ -13,6 +14,11 @@ from pathlib import Path
 from typing import Iterable
 
 
+# Modules that mutate shared repo paths (test_repo_hygiene deletes
+# .github/scripts/__pycache__) run alone after the parallel batch.
+SERIAL_MODULE_NAMES = frozenset({"test_repo_hygiene.py"})
+
+
 @dataclass(frozen=True)
 class ModuleResult:
     path: str
@@ -46,24 +52,46 @@ def run_module(module_path: Path) -> ModuleResult:
     )
 
 
-def run_modules(modules: Iterable[Path], workers: int) -> list[ModuleResult]:
+def run_modules(
+    modules: Iterable[Path],
+    workers: int,
+    serial_names: frozenset[str] = SERIAL_MODULE_NAMES,
+) -> list[ModuleResult]:
     module_list = list(modules)
     if workers == 1:
         return [run_module(module_path) for module_path in module_list]
 
+    parallel_modules = [path for path in module_list if path.name not in serial_names]
+    serial_modules = [path for path in module_list if path.name in serial_names]
+
     results: list[ModuleResult] = []
     with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
-        futures = [executor.submit(run_module, module_path) for module_path in module_list]
+        futures = [executor.submit(run_module, module_path) for module_path in parallel_modules]
         for future in concurrent.futures.as_completed(futures):
             results.append(future.result())
+    results.extend(run_module(module_path) for module_path in serial_modules)
     return sorted(results, key=lambda item: item.path)
 
 
+def parse_workers(value: str) -> int:
+    if value == "auto":
+        return os.cpu_count() or 1
+    try:
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid worker count: {value!r}") from None
+
+
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run helper unittest modules in parallel while preserving discovery scope/pattern.",
     )
-    parser.add_argument("--workers", type=int, default=4, help="parallel worker count (default: 4)")
+    parser.add_argument(
+        "--workers",
+        type=parse_workers,
+        default=4,
+        help="parallel worker count, or 'auto' for one per CPU (default: 4)",
+    )
     parser.add_argument("--start-dir", default=".github/scripts", help="module discovery directory")
     parser.add_argument("--pattern", default="test_*.py", help="module file glob pattern")
     parser.add_argument("--quiet", action="store_true", help="suppress per-module summary output")
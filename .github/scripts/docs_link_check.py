@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import argparse
+import concurrent.futures
 import json
+import os
 import re
 from dataclasses import dataclass
 from pathlib import Path
@@ -11,6 +13,7 @@ from pathlib import Path
 
 LINK_PATTERN = re.compile(r"\[[^\]]+\]\(([^)]+)\)")
 SKIP_PREFIXES = ("http://", "https://", "mailto:", "tel:")
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
 
 
 @dataclass(frozen=True)
@@ -57,15 +60,37 @@ def discover_markdown_files(repo_root: Path, explicit_files: list[str]) -> list[
     return sorted(path for path in repo_root.rglob("*.md") if path.is_file())
 
 
+def collect_link_targets(repo_root: Path, markdown_file: Path) -> list[tuple[str, Path]]:
+    source_text = markdown_file.read_text(encoding="utf-8")
+    targets: list[tuple[str, Path]] = []
+    for link in extract_links(source_text):
+        target = normalize_link_target(markdown_file, link, repo_root)
+        if target is not None:
+            targets.append((link, target))
+    return targets
+
+
 def check_markdown_links(repo_root: Path, markdown_files: list[Path]) -> list[LinkIssue]:
+    if len(markdown_files) <= 1:
+        collected = [
+            collect_link_targets(repo_root, markdown_file) for markdown_file in markdown_files
+        ]
+    else:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(collect_link_targets, repo_root, markdown_file)
+                for markdown_file in markdown_files
+            ]
+            collected = [future.result() for future in futures]
+
+    # Many docs link to the same targets, so stat each unique path only once.
+    wanted = {target for targets in collected for _, target in targets}
+    existing = {target for target in wanted if target.exists()}
+
     issues: list[LinkIssue] = []
-    for markdown_file in markdown_files:
-        source_text = markdown_file.read_text(encoding="utf-8")
-        for link in extract_links(source_text):
-            target = normalize_link_target(markdown_file, link, repo_root)
-            if target is None:
-                continue
-            if not target.exists():
+    for markdown_file, targets in zip(markdown_files, collected):
+        for link, target in targets:
+            if target not in existing:
                 issues.append(
                     LinkIssue(
                         source=markdown_file,
@@ -212,7 +212,7 @@ def render_human_report(
     return "\n".join(lines)
 
 
-def parse_args() -> argparse.Namespace:
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Validate production Rust source file line budgets with actionable CI annotations."
     )
@@ -244,11 +244,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Disable GitHub Actions ::error annotation output",
     )
-    return parser.parse_args()
+    return parser.parse_args(argv)
 
 
-def main() -> int:
-    args = parse_args()
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
     repo_root = Path(args.repo_root).resolve()
 
     if args.default_threshold < 1:
@@ -58,8 +58,10 @@ def has_preceding_line_doc(lines: list[str], index: int) -> bool:
     return bool(LINE_DOC_PATTERN.match(lines[cursor]))
 
 
-def extract_public_items(path: Path) -> list[PublicItem]:
-    lines = path.read_text(encoding="utf-8").splitlines()
+def extract_public_items_from_source(source: str | bytes, file_path: Path) -> list[PublicItem]:
+    if isinstance(source, bytes):
+        source = source.decode("utf-8")
+    lines = source.splitlines()
     items: list[PublicItem] = []
     for index, line in enumerate(lines):
         match = PUB_ITEM_PATTERN.match(line)
@@ -68,7 +70,7 @@ def extract_public_items(path: Path) -> list[PublicItem]:
         kind = match.group("kind")
         items.append(
             PublicItem(
-                file_path=path,
+                file_path=file_path,
                 line=index + 1,
                 kind=kind,
                 signature=line.strip(),
@@ -78,6 +80,10 @@ def extract_public_items(path: Path) -> list[PublicItem]:
     return items
 
 
+def extract_public_items(path: Path) -> list[PublicItem]:
+    return extract_public_items_from_source(path.read_bytes(), path)
+
+
 def discover_crate_dirs(crates_root: Path) -> list[Path]:
     crate_dirs: list[Path] = []
     if not crates_root.exists():
@@ -4,14 +4,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
-
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
-
-import architecture_docs_check  # noqa: E402
-
-
-REPO_ROOT = SCRIPT_DIR.parents[1]
+from _paths import REPO_ROOT, SCRIPT_DIR
+import architecture_docs_check
 
 
 class ArchitectureDocsCheckTests(unittest.TestCase):
@@ -1,10 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SPLIT_MAP_SCRIPT = REPO_ROOT / "scripts" / "dev" / "benchmark-artifact-split-map.sh"
 SCHEMA_PATH = REPO_ROOT / "tasks" / "schemas" / "m25-benchmark-artifact-split-map.schema.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "benchmark-artifact-split-map.md"
@@ -1,10 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "build-test-latency-baseline.sh"
 SCHEMA_PATH = REPO_ROOT / "tasks" / "schemas" / "m25-build-test-latency-baseline.schema.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "build-test-latency-baseline.md"
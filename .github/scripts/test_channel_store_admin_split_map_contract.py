@@ -1,10 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SPLIT_MAP_SCRIPT = REPO_ROOT / "scripts" / "dev" / "channel-store-admin-split-map.sh"
 SCHEMA_PATH = REPO_ROOT / "tasks" / "schemas" / "m25-channel-store-admin-split-map.schema.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "channel-store-admin-split-map.md"
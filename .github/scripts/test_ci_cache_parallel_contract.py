@@ -1,9 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "ci.yml"
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "ci-cache-parallel-tuning-report.sh"
 RUNNER_PATH = REPO_ROOT / ".github" / "scripts" / "ci_helper_parallel_runner.py"
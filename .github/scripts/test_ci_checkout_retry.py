@@ -5,14 +5,10 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT, SCRIPT_DIR
+import ci_checkout_retry
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
 
-import ci_checkout_retry  # noqa: E402
-
-
-REPO_ROOT = SCRIPT_DIR.parents[1]
 WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "ci.yml"
 
 
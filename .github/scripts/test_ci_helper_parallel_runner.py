@@ -1,3 +1,4 @@
+import argparse
 import subprocess
 import sys
 import tempfile
@@ -5,11 +6,8 @@ import textwrap
 import unittest
 from pathlib import Path
 
-
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
-
-import ci_helper_parallel_runner  # noqa: E402
+from _paths import SCRIPT_DIR
+import ci_helper_parallel_runner
 
 
 class CiHelperParallelRunnerTests(unittest.TestCase):
@@ -23,6 +21,44 @@ class CiHelperParallelRunnerTests(unittest.TestCase):
             modules = ci_helper_parallel_runner.discover_modules(root, "test_*.py")
             self.assertEqual([path.name for path in modules], ["test_a.py", "test_b.py"])
 
+    def test_unit_parse_workers_accepts_auto_and_integers(self):
+        self.assertGreaterEqual(ci_helper_parallel_runner.parse_workers("auto"), 1)
+        self.assertEqual(ci_helper_parallel_runner.parse_workers("3"), 3)
+        with self.assertRaises(argparse.ArgumentTypeError):
+            ci_helper_parallel_runner.parse_workers("many")
+
+    def test_unit_run_modules_runs_serial_modules_after_parallel_batch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            for name in ("test_b.py", "test_c.py"):
+                (root / name).write_text(
+                    f"from pathlib import Path\nPath({str(root / (name + '.done'))!r}).touch()\n",
+                    encoding="utf-8",
+                )
+            # Sorts first, so it would run before the markers exist without the serial split.
+            (root / "test_a_serial.py").write_text(
+                textwrap.dedent(
+                    f"""
+                    import sys
+                    from pathlib import Path
+
+                    root = Path({str(root)!r})
+                    sys.exit(0 if all((root / name).exists() for name in ("test_b.py.done", "test_c.py.done")) else 1)
+                    """
+                ),
+                encoding="utf-8",
+            )
+            modules = ci_helper_parallel_runner.discover_modules(root, "test_*.py")
+            results = ci_helper_parallel_runner.run_modules(
+                modules,
+                workers=2,
+                serial_names=frozenset({"test_a_serial.py"}),
+            )
+            self.assertEqual(
+                [(Path(result.path).name, result.return_code) for result in results],
+                [("test_a_serial.py", 0), ("test_b.py", 0), ("test_c.py", 0)],
+            )
+
     def test_functional_cli_runs_discovered_modules_in_parallel(self):
         script_path = SCRIPT_DIR / "ci_helper_parallel_runner.py"
         with tempfile.TemporaryDirectory() as temp_dir:
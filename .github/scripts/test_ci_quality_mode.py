@@ -4,11 +4,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
-
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
-
-import ci_quality_mode  # noqa: E402
+from _paths import SCRIPT_DIR
+import ci_quality_mode
 
 
 class QualityModeTests(unittest.TestCase):
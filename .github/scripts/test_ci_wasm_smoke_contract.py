@@ -1,8 +1,8 @@
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "ci.yml"
 
 
@@ -0,0 +1,42 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from _contract_checks import assert_regular_file, find_missing_snippets
+
+
+class ContractChecksTests(unittest.TestCase):
+    def test_unit_find_missing_snippets_detects_absent_requirements(self):
+        missing = find_missing_snippets(
+            b"permissions:\n  contents: read\n",
+            (b"contents: read", b"issues: read"),
+        )
+        self.assertEqual(missing, [b"issues: read"])
+
+    def test_unit_find_missing_snippets_handles_nested_snippets(self):
+        missing = find_missing_snippets(
+            "run scripts/dev/test-fast-lane-dev-loop.sh before merging",
+            (
+                "fast-lane-dev-loop.sh",
+                "test-fast-lane-dev-loop.sh",
+                "m25-fast-lane-loop-comparison.json",
+            ),
+        )
+        self.assertEqual(missing, ["m25-fast-lane-loop-comparison.json"])
+
+    def test_unit_find_missing_snippets_accepts_empty_requirements(self):
+        self.assertEqual(find_missing_snippets("any text", ()), [])
+
+    def test_unit_assert_regular_file_rejects_directories_and_missing_paths(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "present.txt").write_bytes(b"ok\n")
+            self.assertEqual(assert_regular_file(self, root / "present.txt", "file").st_size, 3)
+            with self.assertRaises(AssertionError):
+                assert_regular_file(self, root, "file")
+            with self.assertRaises(AssertionError):
+                assert_regular_file(self, root / "absent.txt", "file")
+
+
+if __name__ == "__main__":
+    unittest.main()
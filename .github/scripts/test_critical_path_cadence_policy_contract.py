@@ -4,9 +4,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 CADENCE_SCRIPT = REPO_ROOT / "scripts" / "dev" / "critical-path-cadence-check.sh"
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "critical-path-update-cadence-policy.json"
 CHECKLIST_PATH = REPO_ROOT / "tasks" / "templates" / "critical-path-cadence-checklist.md"
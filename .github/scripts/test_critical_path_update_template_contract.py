@@ -1,10 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 TEMPLATE_PATH = REPO_ROOT / "tasks" / "templates" / "critical-path-update-template.md"
 RUBRIC_PATH = REPO_ROOT / "tasks" / "policies" / "critical-path-risk-rubric.json"
 SYNC_GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
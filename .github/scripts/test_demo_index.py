@@ -4,9 +4,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 DEMO_INDEX_SCRIPT = REPO_ROOT / "scripts" / "demo" / "index.sh"
 DEMO_ALL_SCRIPT = REPO_ROOT / "scripts" / "demo" / "all.sh"
 DEMO_SMOKE_MANIFEST = REPO_ROOT / ".github" / "demo-smoke-manifest.json"
@@ -16,6 +16,10 @@ def run_command(args: list[str]) -> subprocess.CompletedProcess[str]:
     return subprocess.run(
         args,
         cwd=REPO_ROOT,
+        # No inherited stdin, and no fd-closing loop in the child: Python fds
+        # are already non-inheritable.
+        stdin=subprocess.DEVNULL,
+        close_fds=False,
         text=True,
         capture_output=True,
         check=False,
@@ -77,9 +81,9 @@ class DemoIndexTests(unittest.TestCase):
             self.assertTrue(report_file.exists())
             self.assertTrue(manifest_file.exists())
             stdout_payload = json.loads(result.stdout)
-            file_payload = json.loads(report_file.read_text(encoding="utf-8"))
+            file_payload = json.loads(report_file.read_bytes())
             self.assertEqual(stdout_payload, file_payload)
-            manifest_payload = json.loads(manifest_file.read_text(encoding="utf-8"))
+            manifest_payload = json.loads(manifest_file.read_bytes())
             self.assertEqual(manifest_payload["schema_version"], 1)
             self.assertEqual(manifest_payload["pack_name"], "demo-index-live-proof-pack")
             self.assertEqual(manifest_payload["producer"]["script"], "scripts/demo/index.sh")
@@ -135,7 +139,7 @@ class DemoIndexTests(unittest.TestCase):
         self.assertIn("unknown scenario names", unknown_result.stderr)
 
     def test_regression_demo_smoke_manifest_includes_story_889_core_commands(self):
-        manifest = json.loads(DEMO_SMOKE_MANIFEST.read_text(encoding="utf-8"))
+        manifest = json.loads(DEMO_SMOKE_MANIFEST.read_bytes())
         command_names = [entry["name"] for entry in manifest["commands"]]
         self.assertIn("onboard-non-interactive", command_names)
         self.assertIn("gateway-remote-profile-token-auth", command_names)
@@ -5,8 +5,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT
+
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 SCRIPTS_DIR = REPO_ROOT / "scripts" / "demo"
 
 
@@ -132,14 +133,17 @@ exit 1
     path.chmod(0o755)
 
 
+SLEEPING_BINARY_TEMPLATE = """#!/usr/bin/env bash
+set -euo pipefail
+sleep {sleep_seconds}
+echo "mock-slow-ok $*"
+"""
+
+
 def write_sleeping_binary(path: Path, sleep_seconds: int = 5) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text(
-        f"""#!/usr/bin/env bash
-set -euo pipefail
-sleep {sleep_seconds}
-echo \"mock-slow-ok $*\"
-""",
+        SLEEPING_BINARY_TEMPLATE.format(sleep_seconds=sleep_seconds),
         encoding="utf-8",
     )
     path.chmod(0o755)
@@ -163,12 +167,38 @@ chmod +x "${TAU_DEMO_BUILT_BINARY}"
     path.chmod(0o755)
 
 
+def make_demo_repo_root(parent: Path) -> Path:
+    # Demo wrappers write .tau/ state under --repo-root; a symlinked mirror of
+    # the checkout keeps those runtime artifacts inside the test's temp dir.
+    repo_root = parent / "repo"
+    repo_root.mkdir()
+    for entry in REPO_ROOT.iterdir():
+        if entry.name not in {".git", ".tau"}:
+            (repo_root / entry.name).symlink_to(entry)
+    return repo_root
+
+
+def _run(command: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+    # Python fds are non-inheritable by default, so close_fds=False skips the
+    # child's fd-closing loop without leaking anything; the wrappers never read stdin.
+    options: dict[str, object] = {
+        "stdin": subprocess.DEVNULL,
+        "close_fds": False,
+        "text": True,
+        "capture_output": True,
+        "check": False,
+    }
+    options.update(kwargs)
+    return subprocess.run(command, **options)
+
+
 def run_demo_script(
     script_name: str,
     binary_path: Path,
     trace_path: Path,
     extra_args: list[str] | None = None,
     extra_env: dict[str, str] | None = None,
+    repo_root: Path = REPO_ROOT,
 ) -> subprocess.CompletedProcess[str]:
     script_path = SCRIPTS_DIR / script_name
     env = dict(os.environ)
@@ -179,19 +209,13 @@ def run_demo_script(
         str(script_path),
         "--skip-build",
         "--repo-root",
-        str(REPO_ROOT),
+        str(repo_root),
         "--binary",
         str(binary_path),
     ]
     if extra_args:
         command.extend(extra_args)
-    return subprocess.run(
-        command,
-        env=env,
-        text=True,
-        capture_output=True,
-        check=False,
-    )
+    return _run(command, env=env)
 
 
 def assert_duration_ms_field(test_case: unittest.TestCase, entry: dict[str, object]) -> None:
@@ -202,33 +226,60 @@ def assert_duration_ms_field(test_case: unittest.TestCase, entry: dict[str, obje
 
 
 class DemoScriptsTests(unittest.TestCase):
+    _full_all_script_run: tuple[subprocess.CompletedProcess[str], list[object]] | None = None
+
+    @classmethod
+    def full_all_script_run(cls) -> tuple[subprocess.CompletedProcess[str], list[object]]:
+        # Two tests assert on the same full all.sh pass with identical inputs.
+        if cls._full_all_script_run is None:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                root = Path(temp_dir)
+                binary_path = root / "bin" / "tau-coding-agent"
+                trace_path = root / "trace.ndjson"
+                write_mock_binary(binary_path)
+
+                # The full pass runs every wrapper, so keep its .tau/ state out of the checkout.
+                completed = run_demo_script(
+                    "all.sh",
+                    binary_path,
+                    trace_path,
+                    repo_root=make_demo_repo_root(root),
+                )
+                rows = []
+                if trace_path.exists():
+                    rows = [
+                        json.loads(line)
+                        for line in trace_path.read_text(encoding="utf-8").splitlines()
+                    ]
+            cls._full_all_script_run = (completed, rows)
+        return cls._full_all_script_run
+
+    def test_functional_wrappers_resolve_repo_files_through_mirrored_repo_root(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            binary_path = root / "bin" / "tau-coding-agent"
+            trace_path = root / "trace.ndjson"
+            write_mock_binary(binary_path)
+            repo_root = make_demo_repo_root(root)
+
+            # local.sh requires examples/ files; memory.sh writes .tau/ state.
+            for script_name in ("local.sh", "memory.sh"):
+                with self.subTest(script=script_name):
+                    completed = run_demo_script(
+                        script_name, binary_path, trace_path, repo_root=repo_root
+                    )
+                    self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+            self.assertTrue((repo_root / ".tau" / "demo-memory" / "state.json").is_file())
+
     def test_unit_script_argument_parser_rejects_unknown_argument(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "local.sh"), "--definitely-unknown"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        self.assertEqual(completed.returncode, 2)
-        self.assertIn("unknown argument: --definitely-unknown", completed.stderr)
-
-    def test_unit_all_script_argument_parser_rejects_unknown_argument(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--definitely-unknown"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        self.assertEqual(completed.returncode, 2)
-        self.assertIn("unknown argument: --definitely-unknown", completed.stderr)
+        for script_name in ("local.sh", "all.sh", "voice-live.sh"):
+            with self.subTest(script=script_name):
+                completed = _run([str(SCRIPTS_DIR / script_name), "--definitely-unknown"])
+                self.assertEqual(completed.returncode, 2)
+                self.assertIn("unknown argument: --definitely-unknown", completed.stderr)
 
     def test_unit_all_script_list_prints_deterministic_inventory(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--list"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        completed = _run([str(SCRIPTS_DIR / "all.sh"), "--list"])
         self.assertEqual(completed.returncode, 0)
         self.assertEqual(
             completed.stdout.strip().splitlines(),
@@ -253,56 +304,26 @@ class DemoScriptsTests(unittest.TestCase):
         )
 
     def test_unit_all_script_only_rejects_unknown_demo_names(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--only", "rpc,unknown-demo"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        completed = _run([str(SCRIPTS_DIR / "all.sh"), "--only", "rpc,unknown-demo"])
         self.assertEqual(completed.returncode, 2)
         self.assertIn("unknown demo names in --only", completed.stderr)
         self.assertIn("unknown-demo", completed.stderr)
 
     def test_unit_all_script_report_file_requires_value(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--report-file"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        completed = _run([str(SCRIPTS_DIR / "all.sh"), "--report-file"])
         self.assertEqual(completed.returncode, 2)
         self.assertIn("missing value for --report-file", completed.stderr)
 
     def test_unit_all_script_fail_fast_flag_is_accepted(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--list", "--fail-fast"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        completed = _run([str(SCRIPTS_DIR / "all.sh"), "--list", "--fail-fast"])
         self.assertEqual(completed.returncode, 0)
         self.assertIn("local.sh", completed.stdout)
 
     def test_unit_all_script_timeout_flag_is_accepted(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--list", "--timeout-seconds", "5"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        completed = _run([str(SCRIPTS_DIR / "all.sh"), "--list", "--timeout-seconds", "5"])
         self.assertEqual(completed.returncode, 0)
         self.assertIn("local.sh", completed.stdout)
 
-    def test_unit_voice_live_script_argument_parser_rejects_unknown_argument(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "voice-live.sh"), "--definitely-unknown"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        self.assertEqual(completed.returncode, 2)
-        self.assertIn("unknown argument: --definitely-unknown", completed.stderr)
-
     def test_functional_demo_scripts_run_expected_command_chains(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
             root = Path(temp_dir)
@@ -362,7 +383,7 @@ class DemoScriptsTests(unittest.TestCase):
 
             manifest_path = state_dir / "artifact-manifest.json"
             self.assertTrue(manifest_path.exists())
-            payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+            payload = json.loads(manifest_path.read_bytes())
             self.assertEqual(payload["schema_version"], 1)
             self.assertEqual(payload["demo"], "voice-live")
             self.assertEqual(payload["state_dir"], str(state_dir))
@@ -429,7 +450,7 @@ class DemoScriptsTests(unittest.TestCase):
             env["TAU_DEMO_BUILT_BINARY"] = str(binary_path)
             env["TAU_DEMO_BINARY_TEMPLATE"] = str(binary_template)
 
-            completed = subprocess.run(
+            completed = _run(
                 [
                     str(SCRIPTS_DIR / "all.sh"),
                     "--repo-root",
@@ -440,9 +461,6 @@ class DemoScriptsTests(unittest.TestCase):
                     "local,rpc",
                 ],
                 env=env,
-                text=True,
-                capture_output=True,
-                check=False,
             )
             self.assertEqual(completed.returncode, 0, msg=completed.stderr)
             self.assertIn("[demo:all] summary: total=2 passed=2 failed=0", completed.stdout)
@@ -453,22 +471,14 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertTrue(binary_path.exists())
 
     def test_functional_all_script_runs_all_demo_wrappers(self) -> None:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            binary_path = root / "bin" / "tau-coding-agent"
-            trace_path = root / "trace.ndjson"
-            write_mock_binary(binary_path)
-
-            completed = run_demo_script("all.sh", binary_path, trace_path)
-            self.assertEqual(
-                completed.returncode,
-                0,
-                msg=f"all.sh failed\nstdout:\n{completed.stdout}\nstderr:\n{completed.stderr}",
-            )
-            self.assertIn("[demo:all] summary: total=16 passed=16 failed=0", completed.stdout)
-
-            rows = [json.loads(line) for line in trace_path.read_text(encoding="utf-8").splitlines()]
-            self.assertGreaterEqual(len(rows), 30)
+        completed, rows = self.full_all_script_run()
+        self.assertEqual(
+            completed.returncode,
+            0,
+            msg=f"all.sh failed\nstdout:\n{completed.stdout}\nstderr:\n{completed.stderr}",
+        )
+        self.assertIn("[demo:all] summary: total=16 passed=16 failed=0", completed.stdout)
+        self.assertGreaterEqual(len(rows), 30)
 
     def test_functional_all_script_only_runs_selected_demo_wrappers(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -522,7 +532,7 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertTrue(report_path.exists())
             self.assertTrue(manifest_path.exists())
 
-            payload = json.loads(report_path.read_text(encoding="utf-8"))
+            payload = json.loads(report_path.read_bytes())
             self.assertEqual(payload["summary"], {"total": 16, "passed": 16, "failed": 0})
             self.assertEqual(
                 [entry["name"] for entry in payload["demos"]],
@@ -548,7 +558,7 @@ class DemoScriptsTests(unittest.TestCase):
             for entry in payload["demos"]:
                 assert_duration_ms_field(self, entry)
 
-            manifest_payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+            manifest_payload = json.loads(manifest_path.read_bytes())
             self.assertEqual(manifest_payload["schema_version"], 1)
             self.assertEqual(manifest_payload["pack_name"], "demo-all-live-proof-pack")
             self.assertEqual(manifest_payload["producer"]["script"], "scripts/demo/all.sh")
@@ -616,30 +626,24 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertIn("./examples/starter/package.json", recorded)
 
     def test_integration_all_script_runs_demos_in_expected_order(self) -> None:
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            binary_path = root / "bin" / "tau-coding-agent"
-            trace_path = root / "trace.ndjson"
-            write_mock_binary(binary_path)
-
-            completed = run_demo_script("all.sh", binary_path, trace_path)
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-            self.assertIn("[demo:all] [1] local.sh", completed.stdout)
-            self.assertIn("[demo:all] [2] rpc.sh", completed.stdout)
-            self.assertIn("[demo:all] [3] events.sh", completed.stdout)
-            self.assertIn("[demo:all] [4] package.sh", completed.stdout)
-            self.assertIn("[demo:all] [5] multi-channel.sh", completed.stdout)
-            self.assertIn("[demo:all] [6] multi-agent.sh", completed.stdout)
-            self.assertIn("[demo:all] [7] browser-automation.sh", completed.stdout)
-            self.assertIn("[demo:all] [8] browser-automation-live.sh", completed.stdout)
-            self.assertIn("[demo:all] [9] memory.sh", completed.stdout)
-            self.assertIn("[demo:all] [10] dashboard.sh", completed.stdout)
-            self.assertIn("[demo:all] [11] gateway.sh", completed.stdout)
-            self.assertIn("[demo:all] [12] gateway-auth.sh", completed.stdout)
-            self.assertIn("[demo:all] [13] gateway-remote-access.sh", completed.stdout)
-            self.assertIn("[demo:all] [14] deployment.sh", completed.stdout)
-            self.assertIn("[demo:all] [15] custom-command.sh", completed.stdout)
-            self.assertIn("[demo:all] [16] voice.sh", completed.stdout)
+        completed, _ = self.full_all_script_run()
+        self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+        self.assertIn("[demo:all] [1] local.sh", completed.stdout)
+        self.assertIn("[demo:all] [2] rpc.sh", completed.stdout)
+        self.assertIn("[demo:all] [3] events.sh", completed.stdout)
+        self.assertIn("[demo:all] [4] package.sh", completed.stdout)
+        self.assertIn("[demo:all] [5] multi-channel.sh", completed.stdout)
+        self.assertIn("[demo:all] [6] multi-agent.sh", completed.stdout)
+        self.assertIn("[demo:all] [7] browser-automation.sh", completed.stdout)
+        self.assertIn("[demo:all] [8] browser-automation-live.sh", completed.stdout)
+        self.assertIn("[demo:all] [9] memory.sh", completed.stdout)
+        self.assertIn("[demo:all] [10] dashboard.sh", completed.stdout)
+        self.assertIn("[demo:all] [11] gateway.sh", completed.stdout)
+        self.assertIn("[demo:all] [12] gateway-auth.sh", completed.stdout)
+        self.assertIn("[demo:all] [13] gateway-remote-access.sh", completed.stdout)
+        self.assertIn("[demo:all] [14] deployment.sh", completed.stdout)
+        self.assertIn("[demo:all] [15] custom-command.sh", completed.stdout)
+        self.assertIn("[demo:all] [16] voice.sh", completed.stdout)
 
     def test_integration_multi_channel_demo_includes_live_mode_diagnostics_steps(self) -> None:
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -706,12 +710,7 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertLess(stopped_status_index, stopped_inspect_index)
 
     def test_integration_all_script_list_json_reports_canonical_order(self) -> None:
-        completed = subprocess.run(
-            [str(SCRIPTS_DIR / "all.sh"), "--list", "--json"],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
+        completed = _run([str(SCRIPTS_DIR / "all.sh"), "--list", "--json"])
         self.assertEqual(completed.returncode, 0)
         payload = json.loads(completed.stdout)
         self.assertEqual(
@@ -751,7 +750,7 @@ class DemoScriptsTests(unittest.TestCase):
                 extra_args=["--only", "events,rpc", "--report-file", str(report_path)],
             )
             self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-            payload = json.loads(report_path.read_text(encoding="utf-8"))
+            payload = json.loads(report_path.read_bytes())
             self.assertEqual(
                 [entry["name"] for entry in payload["demos"]],
                 ["rpc.sh", "events.sh"],
@@ -817,11 +816,11 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertIn("TIMEOUT onboard-non-interactive after 1s", completed.stderr)
             self.assertIn("fail-fast triggered", completed.stderr)
 
-            report_payload = json.loads(report_path.read_text(encoding="utf-8"))
+            report_payload = json.loads(report_path.read_bytes())
             self.assertEqual(report_payload, payload)
 
     def test_regression_scripts_fail_closed_when_binary_missing_in_skip_build_mode(self) -> None:
-        completed = subprocess.run(
+        completed = _run(
             [
                 str(SCRIPTS_DIR / "rpc.sh"),
                 "--skip-build",
@@ -830,15 +829,12 @@ class DemoScriptsTests(unittest.TestCase):
                 "--binary",
                 "/tmp/tau-missing-binary",
             ],
-            text=True,
-            capture_output=True,
-            check=False,
         )
         self.assertNotEqual(completed.returncode, 0)
         self.assertIn("missing tau-coding-agent binary", completed.stderr)
 
     def test_regression_all_script_fail_closed_when_binary_missing_in_skip_build_mode(self) -> None:
-        completed = subprocess.run(
+        completed = _run(
             [
                 str(SCRIPTS_DIR / "all.sh"),
                 "--skip-build",
@@ -847,9 +843,6 @@ class DemoScriptsTests(unittest.TestCase):
                 "--binary",
                 "/tmp/tau-missing-binary",
             ],
-            text=True,
-            capture_output=True,
-            check=False,
         )
         self.assertNotEqual(completed.returncode, 0)
         self.assertIn("missing tau-coding-agent binary", completed.stderr)
@@ -878,7 +871,7 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertEqual(completed.returncode, 1)
             self.assertTrue(report_path.exists())
 
-            payload = json.loads(report_path.read_text(encoding="utf-8"))
+            payload = json.loads(report_path.read_bytes())
             self.assertEqual(payload["summary"]["total"], 16)
             self.assertEqual(payload["summary"]["failed"], 16)
             self.assertEqual(payload["summary"]["passed"], 0)
@@ -898,11 +891,8 @@ class DemoScriptsTests(unittest.TestCase):
             self.assertFalse(trace_path.exists())
 
     def test_regression_all_script_manifest_file_requires_report_file(self) -> None:
-        completed = subprocess.run(
+        completed = _run(
             [str(SCRIPTS_DIR / "all.sh"), "--list", "--manifest-file", "/tmp/m21-manifest.json"],
-            text=True,
-            capture_output=True,
-            check=False,
         )
         self.assertEqual(completed.returncode, 2)
         self.assertIn("--manifest-file requires --report-file", completed.stderr)
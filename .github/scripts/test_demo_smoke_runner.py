@@ -1,14 +1,17 @@
+import contextlib
+import io
+import json
+import os
 import subprocess
 import sys
 import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT, SCRIPT_DIR
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 DEFAULT_MANIFEST = REPO_ROOT / ".github" / "demo-smoke-manifest.json"
-sys.path.insert(0, str(SCRIPT_DIR))
 
 import demo_smoke_runner  # noqa: E402
 
@@ -18,6 +21,10 @@ def write_file(path: Path, content: str) -> None:
     path.write_text(content, encoding="utf-8")
 
 
+def write_manifest(path: Path, commands: list[dict[str, object]]) -> None:
+    write_file(path, json.dumps({"schema_version": 1, "commands": commands}, indent=2) + "\n")
+
+
 def write_mock_binary(path: Path) -> None:
     write_file(
         path,
@@ -50,6 +57,25 @@ print("mock-ok " + " ".join(sys.argv[1:]))
 
 
 class DemoSmokeRunnerTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._temp_root = tempfile.TemporaryDirectory()
+        cls.temp_root = Path(cls._temp_root.name)
+        cls.mock_binary = cls.temp_root / "mock-tau-coding-agent"
+        write_mock_binary(cls.mock_binary)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._temp_root.cleanup()
+
+    def make_work_dir(self) -> Path:
+        return Path(tempfile.mkdtemp(dir=self.temp_root))
+
+    def link_mock_binary(self, path: Path) -> None:
+        # Work dirs live under temp_root, so a hardlink avoids rewriting the script.
+        path.parent.mkdir(parents=True, exist_ok=True)
+        os.link(self.mock_binary, path)
+
     def test_unit_repository_manifest_includes_live_mode_and_gateway_diagnostics(self):
         commands = demo_smoke_runner.load_manifest(DEFAULT_MANIFEST)
         names = [command.name for command in commands]
@@ -83,177 +109,154 @@ class DemoSmokeRunnerTests(unittest.TestCase):
         )
 
     def test_unit_load_manifest_accepts_valid_schema_and_commands(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            manifest_path = Path(temp_dir) / "manifest.json"
-            write_file(
-                manifest_path,
-                """{
-  "schema_version": 1,
-  "commands": [
-    {"name": "validate", "args": ["--rpc-capabilities"]},
-    {"name": "show", "args": ["--package-show", "./examples/starter/package.json"]}
-  ]
-}
-""",
-            )
-            commands = demo_smoke_runner.load_manifest(manifest_path)
-            self.assertEqual(len(commands), 2)
-            self.assertEqual(commands[0].name, "validate")
-            self.assertEqual(commands[0].args, ["--rpc-capabilities"])
+        root = self.make_work_dir()
+        manifest_path = root / "manifest.json"
+        write_manifest(
+            manifest_path,
+            [
+                {"name": "validate", "args": ["--rpc-capabilities"]},
+                {"name": "show", "args": ["--package-show", "./examples/starter/package.json"]},
+            ],
+        )
+        commands = demo_smoke_runner.load_manifest(manifest_path)
+        self.assertEqual(len(commands), 2)
+        self.assertEqual(commands[0].name, "validate")
+        self.assertEqual(commands[0].args, ["--rpc-capabilities"])
 
     def test_functional_run_commands_executes_manifest_with_mock_binary(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            manifest_path = root / "manifest.json"
-            binary_path = root / "bin" / "tau-coding-agent"
-            log_dir = root / "logs"
-            write_mock_binary(binary_path)
-            write_file(
-                manifest_path,
-                """{
-  "schema_version": 1,
-  "commands": [
-    {"name": "first", "args": ["--rpc-capabilities"]},
-    {"name": "second", "args": ["--package-validate", "./examples/starter/package.json"]}
-  ]
-}
-""",
-            )
-            commands = demo_smoke_runner.load_manifest(manifest_path)
-            report = demo_smoke_runner.run_commands(
-                commands=commands,
-                binary=binary_path,
-                repo_root=root,
-                log_dir=log_dir,
-                keep_going=False,
-            )
-            self.assertEqual(report.total, 2)
-            self.assertEqual(report.failed, 0)
-            self.assertEqual(report.passed, 2)
-            self.assertTrue((log_dir / "01-first.stdout.log").exists())
-            self.assertTrue((log_dir / "02-second.stdout.log").exists())
+        root = self.make_work_dir()
+        manifest_path = root / "manifest.json"
+        binary_path = root / "bin" / "tau-coding-agent"
+        log_dir = root / "logs"
+        self.link_mock_binary(binary_path)
+        write_manifest(
+            manifest_path,
+            [
+                {"name": "first", "args": ["--rpc-capabilities"]},
+                {
+                    "name": "second",
+                    "args": ["--package-validate", "./examples/starter/package.json"],
+                },
+            ],
+        )
+        commands = demo_smoke_runner.load_manifest(manifest_path)
+        report = demo_smoke_runner.run_commands(
+            commands=commands,
+            binary=binary_path,
+            repo_root=root,
+            log_dir=log_dir,
+            keep_going=False,
+        )
+        self.assertEqual(report.total, 2)
+        self.assertEqual(report.failed, 0)
+        self.assertEqual(report.passed, 2)
+        self.assertTrue((log_dir / "01-first.stdout.log").exists())
+        self.assertTrue((log_dir / "02-second.stdout.log").exists())
 
     def test_functional_run_commands_executes_repository_manifest_with_mock_binary(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            binary_path = root / "bin" / "tau-coding-agent"
-            log_dir = root / "logs"
-            write_mock_binary(binary_path)
-            commands = demo_smoke_runner.load_manifest(DEFAULT_MANIFEST)
-            report = demo_smoke_runner.run_commands(
-                commands=commands,
-                binary=binary_path,
-                repo_root=REPO_ROOT,
-                log_dir=log_dir,
-                keep_going=False,
-            )
-            self.assertEqual(report.failed, 0)
-            self.assertGreaterEqual(report.passed, 10)
+        root = self.make_work_dir()
+        binary_path = root / "bin" / "tau-coding-agent"
+        log_dir = root / "logs"
+        self.link_mock_binary(binary_path)
+        commands = demo_smoke_runner.load_manifest(DEFAULT_MANIFEST)
+        report = demo_smoke_runner.run_commands(
+            commands=commands,
+            binary=binary_path,
+            repo_root=REPO_ROOT,
+            log_dir=log_dir,
+            keep_going=False,
+        )
+        self.assertEqual(report.failed, 0)
+        self.assertGreaterEqual(report.passed, 10)
 
     def test_functional_run_commands_supports_expected_non_zero_exit_and_stderr_check(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            manifest_path = root / "manifest.json"
-            binary_path = root / "bin" / "tau-coding-agent"
-            log_dir = root / "logs"
-            write_mock_binary(binary_path)
-            write_file(
-                manifest_path,
-                """{
-  "schema_version": 1,
-  "commands": [
-    {
-      "name": "expected-failure-contract",
-      "expected_exit_code": 7,
-      "stderr_contains": "forced-failure",
-      "args": ["--fail"]
-    }
-  ]
-}
-""",
-            )
-            commands = demo_smoke_runner.load_manifest(manifest_path)
-            report = demo_smoke_runner.run_commands(
-                commands=commands,
-                binary=binary_path,
-                repo_root=root,
-                log_dir=log_dir,
-                keep_going=False,
-            )
-            self.assertEqual(report.total, 1)
-            self.assertEqual(report.passed, 1)
-            self.assertEqual(report.failed, 0)
-            stderr_log = (log_dir / "01-expected-failure-contract.stderr.log").read_text(
-                encoding="utf-8"
-            )
-            self.assertIn("forced-failure", stderr_log)
+        root = self.make_work_dir()
+        manifest_path = root / "manifest.json"
+        binary_path = root / "bin" / "tau-coding-agent"
+        log_dir = root / "logs"
+        self.link_mock_binary(binary_path)
+        write_manifest(
+            manifest_path,
+            [
+                {
+                    "name": "expected-failure-contract",
+                    "expected_exit_code": 7,
+                    "stderr_contains": "forced-failure",
+                    "args": ["--fail"],
+                },
+            ],
+        )
+        commands = demo_smoke_runner.load_manifest(manifest_path)
+        report = demo_smoke_runner.run_commands(
+            commands=commands,
+            binary=binary_path,
+            repo_root=root,
+            log_dir=log_dir,
+            keep_going=False,
+        )
+        self.assertEqual(report.total, 1)
+        self.assertEqual(report.passed, 1)
+        self.assertEqual(report.failed, 0)
+        stderr_log = (log_dir / "01-expected-failure-contract.stderr.log").read_text(
+            encoding="utf-8"
+        )
+        self.assertIn("forced-failure", stderr_log)
 
     def test_integration_cli_runs_manifest_and_writes_summary(self):
         script_path = SCRIPT_DIR / "demo_smoke_runner.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            manifest_path = root / "manifest.json"
-            binary_path = root / "bin" / "tau-coding-agent"
-            summary_path = root / "summary.md"
-            log_dir = root / "logs"
-            write_mock_binary(binary_path)
-            write_file(
-                manifest_path,
-                """{
-  "schema_version": 1,
-  "commands": [
-    {"name": "single", "args": ["--rpc-capabilities"]}
-  ]
-}
-""",
-            )
-            subprocess.run(
-                [
-                    sys.executable,
-                    str(script_path),
-                    "--repo-root",
-                    str(root),
-                    "--manifest",
-                    str(manifest_path),
-                    "--binary",
-                    str(binary_path),
-                    "--log-dir",
-                    str(log_dir),
-                    "--summary",
-                    str(summary_path),
-                ],
-                check=True,
-            )
-            summary = summary_path.read_text(encoding="utf-8")
-            self.assertIn("### Demo Smoke", summary)
-            self.assertIn("- Status: pass", summary)
-            self.assertIn("- Failed: 0", summary)
-            self.assertTrue((log_dir / "01-single.stdout.log").exists())
-            self.assertTrue((log_dir / "01-single.stderr.log").exists())
+        root = self.make_work_dir()
+        manifest_path = root / "manifest.json"
+        binary_path = root / "bin" / "tau-coding-agent"
+        summary_path = root / "summary.md"
+        log_dir = root / "logs"
+        self.link_mock_binary(binary_path)
+        write_manifest(
+            manifest_path,
+            [
+                {"name": "single", "args": ["--rpc-capabilities"]},
+            ],
+        )
+        subprocess.run(
+            [
+                sys.executable,
+                str(script_path),
+                "--repo-root",
+                str(root),
+                "--manifest",
+                str(manifest_path),
+                "--binary",
+                str(binary_path),
+                "--log-dir",
+                str(log_dir),
+                "--summary",
+                str(summary_path),
+            ],
+            check=True,
+        )
+        summary = summary_path.read_text(encoding="utf-8")
+        self.assertIn("### Demo Smoke", summary)
+        self.assertIn("- Status: pass", summary)
+        self.assertIn("- Failed: 0", summary)
+        self.assertTrue((log_dir / "01-single.stdout.log").exists())
+        self.assertTrue((log_dir / "01-single.stderr.log").exists())
 
     def test_regression_cli_reports_failing_command_name_and_exit_code(self):
-        script_path = SCRIPT_DIR / "demo_smoke_runner.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            manifest_path = root / "manifest.json"
-            binary_path = root / "bin" / "tau-coding-agent"
-            log_dir = root / "logs"
-            write_mock_binary(binary_path)
-            write_file(
-                manifest_path,
-                """{
-  "schema_version": 1,
-  "commands": [
-    {"name": "pass-command", "args": ["--rpc-capabilities"]},
-    {"name": "failing-command", "args": ["--fail"]}
-  ]
-}
-""",
-            )
-            completed = subprocess.run(
+        root = self.make_work_dir()
+        manifest_path = root / "manifest.json"
+        binary_path = root / "bin" / "tau-coding-agent"
+        log_dir = root / "logs"
+        self.link_mock_binary(binary_path)
+        write_manifest(
+            manifest_path,
+            [
+                {"name": "pass-command", "args": ["--rpc-capabilities"]},
+                {"name": "failing-command", "args": ["--fail"]},
+            ],
+        )
+        stdout = io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            return_code = demo_smoke_runner.main(
                 [
-                    sys.executable,
-                    str(script_path),
                     "--repo-root",
                     str(root),
                     "--manifest",
@@ -262,14 +265,11 @@ class DemoSmokeRunnerTests(unittest.TestCase):
                     str(binary_path),
                     "--log-dir",
                     str(log_dir),
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
+                ]
             )
-            self.assertNotEqual(completed.returncode, 0)
-            self.assertIn("[demo-smoke] FAIL failing-command", completed.stdout)
-            self.assertTrue((log_dir / "02-failing-command.stderr.log").exists())
+        self.assertNotEqual(return_code, 0)
+        self.assertIn("[demo-smoke] FAIL failing-command", stdout.getvalue())
+        self.assertTrue((log_dir / "02-failing-command.stderr.log").exists())
 
     def test_regression_repository_manifest_command_names_are_unique(self):
         commands = demo_smoke_runner.load_manifest(DEFAULT_MANIFEST)
@@ -277,37 +277,32 @@ class DemoSmokeRunnerTests(unittest.TestCase):
         self.assertEqual(len(names), len(set(names)))
 
     def test_regression_expected_substring_mismatch_fails_contract(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            manifest_path = root / "manifest.json"
-            binary_path = root / "bin" / "tau-coding-agent"
-            log_dir = root / "logs"
-            write_mock_binary(binary_path)
-            write_file(
-                manifest_path,
-                """{
-  "schema_version": 1,
-  "commands": [
-    {
-      "name": "bad-contract",
-      "expected_exit_code": 7,
-      "stderr_contains": "missing-substring",
-      "args": ["--fail"]
-    }
-  ]
-}
-""",
-            )
-            commands = demo_smoke_runner.load_manifest(manifest_path)
-            report = demo_smoke_runner.run_commands(
-                commands=commands,
-                binary=binary_path,
-                repo_root=root,
-                log_dir=log_dir,
-                keep_going=False,
-            )
-            self.assertEqual(report.passed, 0)
-            self.assertEqual(report.failed, 1)
+        root = self.make_work_dir()
+        manifest_path = root / "manifest.json"
+        binary_path = root / "bin" / "tau-coding-agent"
+        log_dir = root / "logs"
+        self.link_mock_binary(binary_path)
+        write_manifest(
+            manifest_path,
+            [
+                {
+                    "name": "bad-contract",
+                    "expected_exit_code": 7,
+                    "stderr_contains": "missing-substring",
+                    "args": ["--fail"],
+                },
+            ],
+        )
+        commands = demo_smoke_runner.load_manifest(manifest_path)
+        report = demo_smoke_runner.run_commands(
+            commands=commands,
+            binary=binary_path,
+            repo_root=root,
+            log_dir=log_dir,
+            keep_going=False,
+        )
+        self.assertEqual(report.passed, 0)
+        self.assertEqual(report.failed, 1)
 
 
 if __name__ == "__main__":
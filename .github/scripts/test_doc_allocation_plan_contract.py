@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 import unittest
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from _paths import REPO_ROOT
+
 PLAN_PATH = REPO_ROOT / "tasks" / "policies" / "m23-doc-allocation-plan.json"
 TARGETS_PATH = REPO_ROOT / "docs" / "guides" / "doc-density-targets.json"
 SCORECARD_PATH = REPO_ROOT / "docs" / "guides" / "doc-density-scorecard.md"
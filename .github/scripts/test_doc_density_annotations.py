@@ -9,7 +9,8 @@ import tempfile
 import unittest
 from contextlib import redirect_stdout
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from _paths import REPO_ROOT
+
 SCRIPT_PATH = REPO_ROOT / ".github" / "scripts" / "doc_density_annotations.py"
 
 spec = importlib.util.spec_from_file_location("doc_density_annotations", SCRIPT_PATH)
@@ -1,17 +1,44 @@
+import os
 import subprocess
 import tempfile
 import unittest
 from pathlib import Path
 
+from _contract_checks import find_missing_snippets
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "doc-density-gate-artifact.sh"
 SCORECARD_PATH = REPO_ROOT / "docs" / "guides" / "doc-density-scorecard.md"
 DOCS_INDEX_PATH = REPO_ROOT / "docs" / "README.md"
 
+HELP_SNIPPETS = (b"doc-density-gate-artifact.sh", b"--output-json", b"--output-md")
+SCORECARD_SNIPPETS = (
+    b"## Gate Reproducibility Artifact (M23)",
+    b"## Artifact Template",
+    b"## Troubleshooting",
+    b"doc-density-gate-artifact.sh",
+)
+ARTIFACT_KEY_SNIPPETS = (
+    b'"schema_version"',
+    b'"command"',
+    b'"versions"',
+    b'"context"',
+    b'"density_report"',
+)
+DOCS_INDEX_SNIPPETS = (b"Doc Density Scorecard", b"doc-density-scorecard.md")
+
 
 class DocDensityGateArtifactContractTests(unittest.TestCase):
+    def assert_snippets_present(self, data: bytes, snippets: tuple[bytes, ...], label: str) -> None:
+        missing = find_missing_snippets(data, snippets)
+        # Decode for the message so it reads as text, not a bytes repr.
+        self.assertEqual(
+            missing,
+            [],
+            msg=f"{label} missing {[snippet.decode() for snippet in missing]}",
+        )
+
     def test_unit_script_exists_and_is_executable(self):
         self.assertTrue(SCRIPT_PATH.is_file())
         self.assertTrue(SCRIPT_PATH.stat().st_mode & 0o111)
@@ -19,63 +46,62 @@ class DocDensityGateArtifactContractTests(unittest.TestCase):
     def test_functional_script_supports_help(self):
         completed = subprocess.run(
             ["bash", str(SCRIPT_PATH), "--help"],
-            text=True,
             capture_output=True,
             check=False,
         )
-        self.assertEqual(completed.returncode, 0, msg=completed.stderr)
-        self.assertIn("doc-density-gate-artifact.sh", completed.stdout)
-        self.assertIn("--output-json", completed.stdout)
-        self.assertIn("--output-md", completed.stdout)
+        self.assertEqual(completed.returncode, 0, msg=completed.stderr.decode("utf-8", "replace"))
+        self.assert_snippets_present(completed.stdout, HELP_SNIPPETS, "--help output")
 
     def test_integration_scorecard_includes_template_and_troubleshooting(self):
-        scorecard = SCORECARD_PATH.read_text(encoding="utf-8")
-        self.assertIn("## Gate Reproducibility Artifact (M23)", scorecard)
-        self.assertIn("## Artifact Template", scorecard)
-        self.assertIn("## Troubleshooting", scorecard)
-        self.assertIn("doc-density-gate-artifact.sh", scorecard)
+        self.assert_snippets_present(SCORECARD_PATH.read_bytes(), SCORECARD_SNIPPETS, "scorecard")
+
+    def make_output_path(self, suffix: str) -> Path:
+        handle, raw_path = tempfile.mkstemp(suffix=suffix)
+        os.close(handle)
+        path = Path(raw_path)
+        self.addCleanup(path.unlink, missing_ok=True)
+        return path
 
     def test_regression_script_writes_expected_schema_keys(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            tmp = Path(temp_dir)
-            output_json = tmp / "artifact.json"
-            output_md = tmp / "artifact.md"
-
-            completed = subprocess.run(
-                [
-                    "bash",
-                    str(SCRIPT_PATH),
-                    "--repo-root",
-                    str(REPO_ROOT),
-                    "--targets-file",
-                    "docs/guides/doc-density-targets.json",
-                    "--output-json",
-                    str(output_json),
-                    "--output-md",
-                    str(output_md),
-                    "--generated-at",
-                    "2026-02-15T13:00:00Z",
-                    "--quiet",
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
-            self.assertTrue(output_json.is_file())
-            self.assertTrue(output_md.is_file())
-
-            payload = output_json.read_text(encoding="utf-8")
-            self.assertIn('"schema_version"', payload)
-            self.assertIn('"command"', payload)
-            self.assertIn('"versions"', payload)
-            self.assertIn('"context"', payload)
-            self.assertIn('"density_report"', payload)
+        output_json = self.make_output_path(".json")
+        output_md = self.make_output_path(".md")
+
+        completed = subprocess.run(
+            [
+                "bash",
+                str(SCRIPT_PATH),
+                "--repo-root",
+                str(REPO_ROOT),
+                "--targets-file",
+                "docs/guides/doc-density-targets.json",
+                "--output-json",
+                str(output_json),
+                "--output-md",
+                str(output_md),
+                "--generated-at",
+                "2026-02-15T13:00:00Z",
+                "--quiet",
+            ],
+            capture_output=True,
+            check=False,
+        )
+        self.assertEqual(
+            completed.returncode,
+            0,
+            msg=(completed.stdout + completed.stderr).decode("utf-8", "replace"),
+        )
+        # mkstemp pre-creates the outputs, so require content rather than existence.
+        self.assertGreater(output_json.stat().st_size, 0)
+        self.assertGreater(output_md.stat().st_size, 0)
+
+        self.assert_snippets_present(
+            output_json.read_bytes(), ARTIFACT_KEY_SNIPPETS, "artifact json"
+        )
 
     def test_regression_docs_index_references_scorecard(self):
-        docs_index = DOCS_INDEX_PATH.read_text(encoding="utf-8")
-        self.assertIn("Doc Density Scorecard", docs_index)
-        self.assertIn("doc-density-scorecard.md", docs_index)
+        self.assert_snippets_present(
+            DOCS_INDEX_PATH.read_bytes(), DOCS_INDEX_SNIPPETS, "docs index"
+        )
 
 
 if __name__ == "__main__":
@@ -1,10 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "doc-quality-remediation-policy.json"
 TEMPLATE_PATH = REPO_ROOT / "tasks" / "templates" / "doc-quality-remediation-tracker.md"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "doc-quality-remediation.md"
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import json
-from pathlib import Path
 import unittest
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
+from _paths import REPO_ROOT
+
 REPORT_JSON_PATH = REPO_ROOT / "tasks" / "reports" / "m23-doc-quality-spot-audit.json"
 REPORT_MD_PATH = REPO_ROOT / "tasks" / "reports" / "m23-doc-quality-spot-audit.md"
 HELPER_JSON_PATH = REPO_ROOT / "tasks" / "reports" / "m23-doc-quality-audit-helper.json"
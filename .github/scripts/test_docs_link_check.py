@@ -5,14 +5,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
-
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
-
-import docs_link_check  # noqa: E402
-
-
-REPO_ROOT = SCRIPT_DIR.parents[1]
+from _paths import REPO_ROOT, SCRIPT_DIR
+import docs_link_check
 
 
 class DocsLinkCheckTests(unittest.TestCase):
@@ -84,6 +78,36 @@ class DocsLinkCheckTests(unittest.TestCase):
         self.assertIn("docs/guides/multi-channel-event-pipeline.md", readme)
         self.assertIn("docs/guides/doc-density-scorecard.md", readme)
 
+    def test_regression_parallel_check_preserves_file_order(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            markdown_files = []
+            for index in range(12):
+                path = root / f"doc-{index:02d}.md"
+                path.write_text(f"[Missing](./missing-{index:02d}.md)\n", encoding="utf-8")
+                markdown_files.append(path)
+            issues = docs_link_check.check_markdown_links(root, markdown_files)
+            self.assertEqual([issue.source for issue in issues], markdown_files)
+            self.assertEqual(
+                [issue.link for issue in issues],
+                [f"./missing-{index:02d}.md" for index in range(12)],
+            )
+
+    def test_regression_shared_missing_target_reports_each_reference(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "present.md").write_text("# present\n", encoding="utf-8")
+            first = root / "first.md"
+            second = root / "second.md"
+            first.write_text("[Gone](gone.md)\n[Present](present.md)\n", encoding="utf-8")
+            second.write_text("[Gone](./gone.md)\n[Present](/present.md)\n", encoding="utf-8")
+            issues = docs_link_check.check_markdown_links(root, [first, second])
+            self.assertEqual(
+                [(issue.source, issue.link) for issue in issues],
+                [(first, "gone.md"), (second, "./gone.md")],
+            )
+            self.assertEqual(issues[0].resolved_target, issues[1].resolved_target)
+
     def test_regression_cli_reports_missing_link_and_fails(self):
         script_path = SCRIPT_DIR / "docs_link_check.py"
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -1,10 +1,10 @@
 import json
 import unittest
-from pathlib import Path
+
+from _contract_checks import find_missing_snippets
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "fast-lane-dev-loop.sh"
 TEST_SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "test-fast-lane-dev-loop.sh"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "fast-lane-dev-loop.md"
@@ -18,8 +18,26 @@ REQUIRED_GUIDE_SNIPPETS = (
 )
 
 
-def find_missing_snippets(text: str, required_snippets: tuple[str, ...]) -> list[str]:
-    return [snippet for snippet in required_snippets if snippet not in text]
+REPORT_FIELD_TYPES = {
+    "schema_version": int,
+    "baseline_median_ms": int,
+    "fast_lane_median_ms": int,
+    "improvement_ms": int,
+    "status": str,
+    "wrappers": list,
+}
+
+
+def find_shape_violations(payload: dict, field_types: dict[str, type]) -> list[str]:
+    violations = []
+    for field, expected_type in field_types.items():
+        if field not in payload:
+            violations.append(f"missing {field}")
+        elif not isinstance(payload[field], expected_type):
+            violations.append(
+                f"{field}: expected {expected_type.__name__}, got {type(payload[field]).__name__}"
+            )
+    return violations
 
 
 class FastLaneDevLoopContractTests(unittest.TestCase):
@@ -31,15 +49,18 @@ class FastLaneDevLoopContractTests(unittest.TestCase):
         self.assertTrue(REPORT_JSON_PATH.is_file(), msg=f"missing report json: {REPORT_JSON_PATH}")
         self.assertTrue(REPORT_MD_PATH.is_file(), msg=f"missing report md: {REPORT_MD_PATH}")
 
+    def test_unit_find_shape_violations_reports_missing_and_mistyped_fields(self):
+        violations = find_shape_violations(
+            {"schema_version": "1", "status": "improved"},
+            {"schema_version": int, "status": str, "wrappers": list},
+        )
+        self.assertEqual(violations, ["schema_version: expected int, got str", "missing wrappers"])
+
     def test_functional_report_shape(self):
         report = json.loads(REPORT_JSON_PATH.read_text(encoding="utf-8"))
+        violations = find_shape_violations(report, REPORT_FIELD_TYPES)
+        self.assertEqual(violations, [], msg=f"report shape violations: {violations}")
         self.assertEqual(report["schema_version"], 1)
-        self.assertIn("baseline_median_ms", report)
-        self.assertIn("fast_lane_median_ms", report)
-        self.assertIn("improvement_ms", report)
-        self.assertIn("status", report)
-        self.assertIn("wrappers", report)
-        self.assertIsInstance(report["wrappers"], list)
         self.assertGreater(len(report["wrappers"]), 0)
 
     def test_integration_guide_references_wrapper_artifacts(self):
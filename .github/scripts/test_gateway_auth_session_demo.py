@@ -1,9 +1,9 @@
 import subprocess
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 DEMO_SCRIPT = REPO_ROOT / "scripts" / "demo" / "gateway-auth-session.sh"
 RUNBOOK_DOC = REPO_ROOT / "docs" / "guides" / "gateway-auth-session-smoke.md"
 QUICKSTART_DOC = REPO_ROOT / "docs" / "guides" / "quickstart.md"
@@ -5,9 +5,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 EXTRACTOR_SCRIPT = REPO_ROOT / "scripts" / "dev" / "hierarchy-graph-extractor.sh"
 ROADMAP_SYNC_GUIDE = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
 
@@ -32,6 +32,10 @@ def make_issue(
     return payload
 
 
+def write_json_fixture(path: Path, payload: object) -> None:
+    path.write_bytes(json.dumps(payload).encode("utf-8"))
+
+
 class HierarchyGraphExtractorContractTests(unittest.TestCase):
     def test_unit_extractor_script_exists_and_is_executable(self):
         self.assertTrue(EXTRACTOR_SCRIPT.is_file())
@@ -66,7 +70,7 @@ class HierarchyGraphExtractorContractTests(unittest.TestCase):
             fixture_path = tmp / "fixture.json"
             output_json = tmp / "graph.json"
             output_md = tmp / "graph.md"
-            fixture_path.write_text(json.dumps(fixture), encoding="utf-8")
+            write_json_fixture(fixture_path, fixture)
 
             completed = subprocess.run(
                 [
@@ -84,11 +88,14 @@ class HierarchyGraphExtractorContractTests(unittest.TestCase):
                     str(output_md),
                     "--quiet",
                 ],
-                text=True,
                 capture_output=True,
                 check=False,
             )
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+            self.assertEqual(
+                completed.returncode,
+                0,
+                msg=completed.stderr.decode("utf-8", "replace"),
+            )
             self.assertTrue(output_json.is_file())
             self.assertTrue(output_md.is_file())
 
@@ -111,14 +118,14 @@ class HierarchyGraphExtractorContractTests(unittest.TestCase):
             bin_dir = tmp / "bin"
             bin_dir.mkdir(parents=True, exist_ok=True)
             state_file = tmp / "gh-attempt-count"
-            state_file.write_text("0", encoding="utf-8")
+            state_file.write_text("0\n", encoding="utf-8")
 
             fake_gh = bin_dir / "gh"
             fake_gh.write_text(
                 r"""#!/usr/bin/env bash
 set -euo pipefail
 state_file="${FAKE_GH_STATE_FILE:?}"
-count="$(cat "${state_file}")"
+read -r count <"${state_file}"
 count="$((count + 1))"
 echo "${count}" >"${state_file}"
 
@@ -205,12 +212,15 @@ esac
                     "2",
                     "--quiet",
                 ],
-                text=True,
                 capture_output=True,
                 check=False,
                 env=env,
             )
-            self.assertEqual(completed.returncode, 0, msg=completed.stderr)
+            self.assertEqual(
+                completed.returncode,
+                0,
+                msg=completed.stderr.decode("utf-8", "replace"),
+            )
             self.assertTrue(output_json.is_file())
             self.assertTrue(output_md.is_file())
 
@@ -229,7 +239,7 @@ esac
         with tempfile.TemporaryDirectory() as temp_dir:
             tmp = Path(temp_dir)
             fixture_path = tmp / "bad-fixture.json"
-            fixture_path.write_text(json.dumps(malformed_fixture), encoding="utf-8")
+            write_json_fixture(fixture_path, malformed_fixture)
 
             completed = subprocess.run(
                 [
@@ -246,12 +256,11 @@ esac
                     "--output-md",
                     str(tmp / "graph.md"),
                 ],
-                text=True,
                 capture_output=True,
                 check=False,
             )
             self.assertNotEqual(completed.returncode, 0)
-            self.assertIn("must decode to a JSON array", completed.stderr)
+            self.assertIn(b"must decode to a JSON array", completed.stderr)
 
 
 if __name__ == "__main__":
@@ -5,9 +5,9 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 PUBLISH_SCRIPT = REPO_ROOT / "scripts" / "dev" / "hierarchy-graph-publish.sh"
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "hierarchy-graph-publication-policy.json"
 ROADMAP_SYNC_GUIDE = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
@@ -1,9 +1,9 @@
 import json
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 RULES_PATH = REPO_ROOT / "tasks" / "policies" / "issue-hierarchy-drift-rules.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "issue-hierarchy-drift-rules.md"
 SYNC_GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
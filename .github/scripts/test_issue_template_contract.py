@@ -1,9 +1,10 @@
+import functools
 import unittest
-from pathlib import Path
+
+from _contract_checks import find_missing_snippets
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 TEMPLATE_DIR = REPO_ROOT / ".github" / "ISSUE_TEMPLATE"
 
 REQUIRED_TEMPLATES = {
@@ -54,9 +55,21 @@ REQUIRED_TEMPLATES = {
 
 NAMESPACE_TOKENS = ("type:", "area:", "process:", "priority:", "status:")
 
+REQUIRED_SECTION_BYTES = {
+    template_name: tuple(section.encode() for section in contract["must_contain"])
+    for template_name, contract in REQUIRED_TEMPLATES.items()
+}
+
 
-def template_text(name: str) -> str:
-    return (TEMPLATE_DIR / name).read_text(encoding="utf-8")
+# Every check is an ASCII substring test, so templates are kept as raw bytes.
+@functools.lru_cache(maxsize=None)
+def template_bytes(name: str) -> bytes:
+    return (TEMPLATE_DIR / name).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def template_bytes_lower(name: str) -> bytes:
+    return template_bytes(name).lower()
 
 
 class IssueTemplateContractTests(unittest.TestCase):
@@ -68,37 +81,40 @@ class IssueTemplateContractTests(unittest.TestCase):
             self.assertGreater(path.stat().st_size, 0, msg=f"empty template file: {path}")
 
     def test_functional_templates_include_required_metadata_sections(self):
-        for template_name, contract in REQUIRED_TEMPLATES.items():
-            text = template_text(template_name)
-            for section in contract["must_contain"]:
-                self.assertIn(
-                    section,
-                    text,
-                    msg=f"template {template_name} missing section: {section}",
-                )
+        for template_name in REQUIRED_TEMPLATES:
+            missing = find_missing_snippets(
+                template_bytes(template_name),
+                REQUIRED_SECTION_BYTES[template_name],
+            )
+            self.assertEqual(
+                missing,
+                [],
+                msg=f"template {template_name} missing sections: "
+                f"{[section.decode() for section in missing]}",
+            )
 
     def test_integration_templates_encode_required_label_namespaces(self):
         for template_name, contract in REQUIRED_TEMPLATES.items():
-            text = template_text(template_name)
+            data = template_bytes(template_name)
             self.assertIn(
-                contract["type_label"],
-                text,
+                contract["type_label"].encode(),
+                data,
                 msg=f"template {template_name} missing type label: {contract['type_label']}",
             )
             for token in NAMESPACE_TOKENS:
                 self.assertIn(
-                    token,
-                    text,
+                    token.encode(),
+                    data,
                     msg=f"template {template_name} missing namespace token: {token}",
                 )
 
     def test_regression_non_epic_templates_require_parent_metadata(self):
         for template_name in ("story.md", "task.md", "subtask.md"):
-            text = template_text(template_name)
-            self.assertIn("Parent:", text, msg=f"template {template_name} missing parent guidance")
+            data = template_bytes(template_name)
+            self.assertIn(b"Parent:", data, msg=f"template {template_name} missing parent guidance")
             self.assertIn(
-                "exactly one parent",
-                text.lower(),
+                b"exactly one parent",
+                template_bytes_lower(template_name),
                 msg=f"template {template_name} missing single-parent rule",
             )
 
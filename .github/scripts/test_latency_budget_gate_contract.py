@@ -2,9 +2,10 @@ import json
 import unittest
 from pathlib import Path
 
+from _contract_checks import assert_regular_file, find_missing_snippets
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "latency-budget-gate.sh"
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "m25-latency-budget-policy.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "latency-budget-gate.md"
@@ -18,27 +19,40 @@ REQUIRED_GUIDE_SNIPPETS = (
 )
 
 
-def find_missing_snippets(text: str, required_snippets: tuple[str, ...]) -> list[str]:
-    return [snippet for snippet in required_snippets if snippet not in text]
+def load_json_or_none(path: Path) -> dict | None:
+    # Missing files are reported by test_unit_required_paths_exist.
+    try:
+        return json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+
+
+POLICY = load_json_or_none(POLICY_PATH)
+REPORT = load_json_or_none(REPORT_JSON_PATH)
 
 
 class LatencyBudgetGateContractTests(unittest.TestCase):
     def test_unit_required_paths_exist(self):
-        self.assertTrue(SCRIPT_PATH.is_file(), msg=f"missing script: {SCRIPT_PATH}")
-        self.assertTrue(SCRIPT_PATH.stat().st_mode & 0o111)
-        self.assertTrue(POLICY_PATH.is_file(), msg=f"missing policy: {POLICY_PATH}")
-        self.assertTrue(GUIDE_PATH.is_file(), msg=f"missing guide: {GUIDE_PATH}")
-        self.assertTrue(REPORT_JSON_PATH.is_file(), msg=f"missing report json: {REPORT_JSON_PATH}")
-        self.assertTrue(REPORT_MD_PATH.is_file(), msg=f"missing report md: {REPORT_MD_PATH}")
+        script_stat = assert_regular_file(self, SCRIPT_PATH, "script")
+        self.assertTrue(script_stat.st_mode & 0o111)
+        assert_regular_file(self, POLICY_PATH, "policy")
+        assert_regular_file(self, GUIDE_PATH, "guide")
+        assert_regular_file(self, REPORT_JSON_PATH, "report json")
+        assert_regular_file(self, REPORT_MD_PATH, "report md")
 
     def test_functional_policy_shape(self):
-        policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+        self.assertIsNotNone(POLICY, msg=f"missing policy: {POLICY_PATH}")
+        policy = POLICY
         self.assertEqual(policy["schema_version"], 1)
-        self.assertIn("max_fast_lane_median_ms", policy)
-        self.assertIn("min_improvement_percent", policy)
-        self.assertIn("max_regression_percent", policy)
-        self.assertIn("enforcement_mode", policy)
-        self.assertIn("remediation", policy)
+        required = {
+            "max_fast_lane_median_ms",
+            "min_improvement_percent",
+            "max_regression_percent",
+            "enforcement_mode",
+            "remediation",
+        }
+        missing = required - policy.keys()
+        self.assertFalse(missing, msg=f"policy missing keys: {sorted(missing)}")
 
     def test_integration_guide_references_gate_assets(self):
         guide_text = GUIDE_PATH.read_text(encoding="utf-8")
@@ -46,12 +60,12 @@ class LatencyBudgetGateContractTests(unittest.TestCase):
         self.assertEqual(missing, [], msg=f"missing guide snippets: {missing}")
 
     def test_regression_report_shape(self):
-        report = json.loads(REPORT_JSON_PATH.read_text(encoding="utf-8"))
+        self.assertIsNotNone(REPORT, msg=f"missing report json: {REPORT_JSON_PATH}")
+        report = REPORT
         self.assertEqual(report["schema_version"], 1)
-        self.assertIn("status", report)
-        self.assertIn("violations", report)
-        self.assertIn("checks", report)
-        self.assertIn("report_summary", report)
+        required = {"status", "violations", "checks", "report_summary"}
+        missing = required - report.keys()
+        self.assertFalse(missing, msg=f"report missing keys: {sorted(missing)}")
 
 
 if __name__ == "__main__":
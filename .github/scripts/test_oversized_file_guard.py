@@ -1,3 +1,5 @@
+import contextlib
+import io
 import json
 import subprocess
 import sys
@@ -5,14 +7,45 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import SCRIPT_DIR
+import oversized_file_guard
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
 
-import oversized_file_guard  # noqa: E402
+EXEMPTIONS_REL = Path("tasks/policies/oversized-file-exemptions.json")
+DEMO_SRC_REL = Path("crates/demo/src")
+RUST_FIXTURE_LINE = b"pub fn item() {}\n"
+
+
+def run_guard_in_process(argv: list[str]) -> tuple[int, str]:
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        returncode = oversized_file_guard.main(argv)
+    return returncode, stdout.getvalue()
 
 
 class OversizedFileGuardTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._temp_root = tempfile.TemporaryDirectory()
+        cls.temp_root = Path(cls._temp_root.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._temp_root.cleanup()
+
+    def make_repo_root(self, exemptions: list[dict]) -> Path:
+        root = Path(tempfile.mkdtemp(dir=self.temp_root))
+        (root / EXEMPTIONS_REL).parent.mkdir(parents=True)
+        (root / EXEMPTIONS_REL).write_bytes(
+            json.dumps({"schema_version": 1, "exemptions": exemptions}).encode("utf-8")
+        )
+        return root
+
+    def write_rust_file(self, root: Path, name: str, line_count: int) -> None:
+        src_dir = root / DEMO_SRC_REL
+        src_dir.mkdir(parents=True, exist_ok=True)
+        (src_dir / name).write_bytes(RUST_FIXTURE_LINE * line_count)
+
     def test_unit_escape_annotation_encodes_special_chars(self):
         raw = "line:1\n100% complete"
         escaped = oversized_file_guard.escape_annotation(raw)
@@ -20,117 +53,65 @@ class OversizedFileGuardTests(unittest.TestCase):
 
     def test_functional_cli_passes_with_exemption_and_writes_json(self):
         script_path = SCRIPT_DIR / "oversized_file_guard.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            src_dir = root / "crates" / "demo" / "src"
-            src_dir.mkdir(parents=True, exist_ok=True)
-            (src_dir / "large.rs").write_text(
-                "\n".join(["pub fn item() {}" for _ in range(12)]) + "\n",
-                encoding="utf-8",
-            )
-            exemptions = {
-                "schema_version": 1,
-                "exemptions": [
-                    {
-                        "path": "crates/demo/src/large.rs",
-                        "threshold_lines": 20,
-                        "owner_issue": 1754,
-                        "rationale": "fixture exemption",
-                        "approved_by": "ci-test",
-                        "approved_at": "2026-02-15",
-                        "expires_on": "2026-03-15",
-                    }
-                ],
-            }
-            (root / "tasks" / "policies").mkdir(parents=True, exist_ok=True)
-            (root / "tasks" / "policies" / "oversized-file-exemptions.json").write_text(
-                json.dumps(exemptions),
-                encoding="utf-8",
-            )
-            report_rel = Path("ci-artifacts/oversized-file-guard.json")
-            completed = subprocess.run(
-                [
-                    sys.executable,
-                    str(script_path),
-                    "--repo-root",
-                    str(root),
-                    "--default-threshold",
-                    "10",
-                    "--json-output-file",
-                    str(report_rel),
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
-            self.assertIn("issues=0", completed.stdout)
-            report = json.loads((root / report_rel).read_text(encoding="utf-8"))
-            self.assertEqual(report["schema_version"], 1)
-            self.assertEqual(report["issue_count"], 0)
+        root = self.make_repo_root(
+            [
+                {
+                    "path": "crates/demo/src/large.rs",
+                    "threshold_lines": 20,
+                    "owner_issue": 1754,
+                    "rationale": "fixture exemption",
+                    "approved_by": "ci-test",
+                    "approved_at": "2026-02-15",
+                    "expires_on": "2026-03-15",
+                }
+            ]
+        )
+        self.write_rust_file(root, "large.rs", 12)
+        report_rel = Path("ci-artifacts/oversized-file-guard.json")
+        completed = subprocess.run(
+            [
+                sys.executable,
+                str(script_path),
+                "--repo-root",
+                str(root),
+                "--default-threshold",
+                "10",
+                "--json-output-file",
+                str(report_rel),
+            ],
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+        self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
+        self.assertIn("issues=0", completed.stdout)
+        report = json.loads((root / report_rel).read_bytes())
+        self.assertEqual(report["schema_version"], 1)
+        self.assertEqual(report["issue_count"], 0)
 
     def test_regression_cli_emits_annotation_with_path_size_threshold_and_hint(self):
-        script_path = SCRIPT_DIR / "oversized_file_guard.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            src_dir = root / "crates" / "demo" / "src"
-            src_dir.mkdir(parents=True, exist_ok=True)
-            (src_dir / "oversized.rs").write_text(
-                "\n".join(["pub fn item() {}" for _ in range(11)]) + "\n",
-                encoding="utf-8",
-            )
-            (root / "tasks" / "policies").mkdir(parents=True, exist_ok=True)
-            (root / "tasks" / "policies" / "oversized-file-exemptions.json").write_text(
-                json.dumps({"schema_version": 1, "exemptions": []}),
-                encoding="utf-8",
-            )
-            completed = subprocess.run(
-                [
-                    sys.executable,
-                    str(script_path),
-                    "--repo-root",
-                    str(root),
-                    "--default-threshold",
-                    "10",
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertNotEqual(completed.returncode, 0)
-            self.assertIn("issues=1", completed.stdout)
-            self.assertIn(
-                "::error file=crates/demo/src/oversized.rs,line=1,title=Oversized file threshold exceeded::",
-                completed.stdout,
-            )
-            self.assertIn("Split file modules or update auditable exemption metadata", completed.stdout)
+        root = self.make_repo_root([])
+        self.write_rust_file(root, "oversized.rs", 11)
+        returncode, stdout = run_guard_in_process(
+            ["--repo-root", str(root), "--default-threshold", "10"]
+        )
+        self.assertNotEqual(returncode, 0)
+        self.assertIn("issues=1", stdout)
+        self.assertIn(
+            "::error file=crates/demo/src/oversized.rs,line=1,title=Oversized file threshold exceeded::",
+            stdout,
+        )
+        self.assertIn("Split file modules or update auditable exemption metadata", stdout)
 
     def test_regression_cli_reports_metadata_error_for_invalid_exemption_contract(self):
-        script_path = SCRIPT_DIR / "oversized_file_guard.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            (root / "tasks" / "policies").mkdir(parents=True, exist_ok=True)
-            (root / "tasks" / "policies" / "oversized-file-exemptions.json").write_text(
-                json.dumps({"schema_version": 1, "exemptions": [{"path": "x.rs"}]}),
-                encoding="utf-8",
-            )
-            completed = subprocess.run(
-                [
-                    sys.executable,
-                    str(script_path),
-                    "--repo-root",
-                    str(root),
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertNotEqual(completed.returncode, 0)
-            self.assertIn("exemption_metadata_error", completed.stdout)
-            self.assertIn(
-                "::error file=tasks/policies/oversized-file-exemptions.json,line=1,title=Oversized file policy metadata error::",
-                completed.stdout,
-            )
+        root = self.make_repo_root([{"path": "x.rs"}])
+        returncode, stdout = run_guard_in_process(["--repo-root", str(root)])
+        self.assertNotEqual(returncode, 0)
+        self.assertIn("exemption_metadata_error", stdout)
+        self.assertIn(
+            "::error file=tasks/policies/oversized-file-exemptions.json,line=1,title=Oversized file policy metadata error::",
+            stdout,
+        )
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
+import functools
 import json
 import unittest
 from pathlib import Path
 
+from _contract_checks import find_missing_snippets
+from _paths import REPO_ROOT
+
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "pr-batch-lane-boundaries.json"
 EXCEPTIONS_PATH = REPO_ROOT / "tasks" / "policies" / "pr-batch-exceptions.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "pr-batch-lane-boundaries.md"
@@ -11,30 +14,98 @@ SYNC_GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
 PR_TEMPLATE_PATH = REPO_ROOT / ".github" / "pull_request_template.md"
 
 
+# Every test reads the same policy files and docs; parse each once per process.
+@functools.lru_cache(maxsize=None)
 def load_policy() -> dict:
-    return json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    return json.loads(POLICY_PATH.read_bytes())
 
 
+@functools.lru_cache(maxsize=None)
 def load_exceptions() -> dict:
-    return json.loads(EXCEPTIONS_PATH.read_text(encoding="utf-8"))
+    return json.loads(EXCEPTIONS_PATH.read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def policy_lane_ids() -> frozenset[str]:
+    return frozenset(lane["id"] for lane in load_policy()["lanes"])
+
+
+@functools.lru_cache(maxsize=None)
+def required_template_fields() -> tuple[str, ...]:
+    return tuple(load_policy()["pr_reference_contract"]["required_pr_template_fields"])
+
+
+@functools.lru_cache(maxsize=None)
+def required_exception_fields() -> tuple[str, ...]:
+    return tuple(load_policy()["exception_workflow"]["required_fields"])
+
+
+@functools.lru_cache(maxsize=None)
+def read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
+REQUIRED_POLICY_KEYS = frozenset(
+    {
+        "lanes",
+        "high_conflict_hotspots",
+        "batch_size_review_sla_matrix",
+        "exception_workflow",
+        "pr_reference_contract",
+    }
+)
+
+POSITIVE_MATRIX_FIELDS = (
+    "max_open_prs_per_batch",
+    "max_hotspot_paths_per_pr",
+    "target_first_review_hours",
+    "target_merge_hours",
+    "required_reviewers",
+)
 
 
-def find_missing_snippets(text: str, required_snippets: tuple[str, ...]) -> list[str]:
-    return [snippet for snippet in required_snippets if snippet not in text]
+def find_matrix_violations(matrix: list[dict]) -> list[str]:
+    violations = []
+    for entry in matrix:
+        lane = entry.get("lane", "?")
+        for field in POSITIVE_MATRIX_FIELDS:
+            if not entry[field] > 0:
+                violations.append(f"{lane}: {field} must be positive, got {entry[field]}")
+        if entry["target_first_review_hours"] > entry["target_merge_hours"]:
+            violations.append(f"{lane}: target_first_review_hours exceeds target_merge_hours")
+    return violations
 
 
 class PrBatchLaneBoundariesContractTests(unittest.TestCase):
+    def test_unit_find_matrix_violations_reports_each_bad_field(self):
+        violations = find_matrix_violations(
+            [
+                {
+                    "lane": "docs",
+                    "max_open_prs_per_batch": 0,
+                    "max_hotspot_paths_per_pr": 1,
+                    "target_first_review_hours": 48,
+                    "target_merge_hours": 24,
+                    "required_reviewers": 1,
+                }
+            ]
+        )
+        self.assertEqual(
+            violations,
+            [
+                "docs: max_open_prs_per_batch must be positive, got 0",
+                "docs: target_first_review_hours exceeds target_merge_hours",
+            ],
+        )
+
     def test_functional_policy_has_required_lane_boundary_contract(self):
         policy = load_policy()
 
         self.assertEqual(policy["schema_version"], 1)
-        self.assertIn("lanes", policy)
-        self.assertIn("high_conflict_hotspots", policy)
-        self.assertIn("batch_size_review_sla_matrix", policy)
-        self.assertIn("exception_workflow", policy)
-        self.assertIn("pr_reference_contract", policy)
+        missing = REQUIRED_POLICY_KEYS - policy.keys()
+        self.assertEqual(missing, set(), msg=f"policy missing keys: {sorted(missing)}")
 
-        lane_ids = {lane["id"] for lane in policy["lanes"]}
+        lane_ids = policy_lane_ids()
         self.assertEqual(lane_ids, {"structural", "docs", "rl"})
         for lane in policy["lanes"]:
             self.assertGreater(len(lane["owned_path_prefixes"]), 0)
@@ -42,20 +113,12 @@ class PrBatchLaneBoundariesContractTests(unittest.TestCase):
 
         matrix_lane_ids = {entry["lane"] for entry in policy["batch_size_review_sla_matrix"]}
         self.assertEqual(matrix_lane_ids, lane_ids)
-        for entry in policy["batch_size_review_sla_matrix"]:
-            self.assertGreater(entry["max_open_prs_per_batch"], 0)
-            self.assertGreater(entry["max_hotspot_paths_per_pr"], 0)
-            self.assertGreater(entry["target_first_review_hours"], 0)
-            self.assertGreater(entry["target_merge_hours"], 0)
-            self.assertLessEqual(
-                entry["target_first_review_hours"],
-                entry["target_merge_hours"],
-            )
-            self.assertGreater(entry["required_reviewers"], 0)
+        violations = find_matrix_violations(policy["batch_size_review_sla_matrix"])
+        self.assertEqual(violations, [], msg=f"batch size review SLA violations: {violations}")
 
     def test_regression_hotspot_ids_and_lane_ownership_are_consistent(self):
         policy = load_policy()
-        lane_ids = {lane["id"] for lane in policy["lanes"]}
+        lane_ids = policy_lane_ids()
         hotspots = policy["high_conflict_hotspots"]
         hotspot_ids = [entry["id"] for entry in hotspots]
 
@@ -68,34 +131,34 @@ class PrBatchLaneBoundariesContractTests(unittest.TestCase):
     def test_integration_docs_and_template_reference_policy_and_ids(self):
         policy = load_policy()
         exceptions = load_exceptions()
-        guide_text = GUIDE_PATH.read_text(encoding="utf-8")
-        sync_guide_text = SYNC_GUIDE_PATH.read_text(encoding="utf-8")
-        template_text = PR_TEMPLATE_PATH.read_text(encoding="utf-8")
+        guide_text = read_text(GUIDE_PATH)
+        sync_guide_text = read_text(SYNC_GUIDE_PATH)
+        template_text = read_text(PR_TEMPLATE_PATH)
 
         self.assertIn("pr-batch-lane-boundaries.json", guide_text)
         self.assertIn("pr-batch-lane-boundaries.json", sync_guide_text)
         self.assertIn("pr-batch-exceptions.json", guide_text)
         self.assertIn("pr-batch-exceptions.json", sync_guide_text)
 
-        required_template_fields = tuple(
-            policy["pr_reference_contract"]["required_pr_template_fields"]
-        )
-        missing_template_fields = find_missing_snippets(template_text, required_template_fields)
+        missing_template_fields = find_missing_snippets(template_text, required_template_fields())
         self.assertEqual(
             missing_template_fields,
             [],
             msg=f"missing PR template lane fields: {missing_template_fields}",
         )
 
-        for lane in policy["lanes"]:
-            self.assertIn(lane["id"], guide_text)
-            self.assertIn(lane["id"], template_text)
-
-        for hotspot in policy["high_conflict_hotspots"]:
-            self.assertIn(hotspot["id"], guide_text)
+        lane_ids = tuple(sorted(policy_lane_ids()))
+        hotspot_ids = tuple(hotspot["id"] for hotspot in policy["high_conflict_hotspots"])
+        missing_guide_ids = find_missing_snippets(guide_text, lane_ids + hotspot_ids)
+        self.assertEqual(missing_guide_ids, [], msg=f"guide missing ids: {missing_guide_ids}")
+        missing_template_ids = find_missing_snippets(template_text, lane_ids)
+        self.assertEqual(
+            missing_template_ids,
+            [],
+            msg=f"PR template missing lane ids: {missing_template_ids}",
+        )
 
-        required_exception_fields = tuple(policy["exception_workflow"]["required_fields"])
-        missing_exception_fields = find_missing_snippets(guide_text, required_exception_fields)
+        missing_exception_fields = find_missing_snippets(guide_text, required_exception_fields())
         self.assertEqual(
             missing_exception_fields,
             [],
@@ -105,17 +168,16 @@ class PrBatchLaneBoundariesContractTests(unittest.TestCase):
 
     def test_regression_pr_template_references_boundary_map_file(self):
         policy = load_policy()
-        template_text = PR_TEMPLATE_PATH.read_text(encoding="utf-8")
+        template_text = read_text(PR_TEMPLATE_PATH)
         boundary_map = policy["pr_reference_contract"]["boundary_map_reference"]
         self.assertIn(boundary_map, template_text)
 
     def test_regression_exception_tracking_contract_requires_rationale_fields(self):
-        policy = load_policy()
         exceptions = load_exceptions()
 
         self.assertEqual(exceptions["schema_version"], 1)
         self.assertIn("exceptions", exceptions)
-        required_fields = set(policy["exception_workflow"]["required_fields"])
+        required_fields = frozenset(required_exception_fields())
         self.assertIn("rationale", required_fields)
 
         for entry in exceptions["exceptions"]:
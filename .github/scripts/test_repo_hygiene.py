@@ -1,14 +1,23 @@
 import subprocess
 import unittest
-from pathlib import Path
+
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 GITIGNORE_PATH = REPO_ROOT / ".gitignore"
 DEMO_SMOKE_SHELL = REPO_ROOT / "scripts" / "demo-smoke.sh"
 DEMO_SMOKE_RUNNER = REPO_ROOT / ".github" / "scripts" / "demo_smoke_runner.py"
 CLEANUP_SCRIPT = REPO_ROOT / "scripts" / "dev" / "clean-local-artifacts.sh"
+NOISE_PATHS = (
+    REPO_ROOT / "ci-artifacts",
+    REPO_ROOT / ".github" / "scripts" / "__pycache__",
+    REPO_ROOT / "=",
+    REPO_ROOT / "]",
+)
+
+
+def needs_cleanup() -> bool:
+    return any(path.exists() for path in NOISE_PATHS)
 
 
 def run_cleanup() -> subprocess.CompletedProcess[str]:
@@ -22,11 +31,17 @@ def run_cleanup() -> subprocess.CompletedProcess[str]:
 
 
 class RepoHygieneTests(unittest.TestCase):
-    def setUp(self) -> None:
-        run_cleanup()
+    @classmethod
+    def setUpClass(cls) -> None:
+        # tearDown leaves the tree clean for the next test, so one cleanup
+        # up front is enough instead of one before every test.
+        if needs_cleanup():
+            run_cleanup()
 
     def tearDown(self) -> None:
-        run_cleanup()
+        # A few stats are far cheaper than forking the cleanup script.
+        if needs_cleanup():
+            run_cleanup()
 
     def test_unit_gitignore_covers_generated_artifacts(self):
         gitignore = GITIGNORE_PATH.read_text(encoding="utf-8")
@@ -43,22 +58,22 @@ class RepoHygieneTests(unittest.TestCase):
             REPO_ROOT / "=",
             REPO_ROOT / "]",
         ]
+        relative_paths = []
         for generated in generated_files:
             generated.parent.mkdir(parents=True, exist_ok=True)
             generated.write_text("generated\n", encoding="utf-8")
-            relative = str(generated.relative_to(REPO_ROOT))
-            ignored = subprocess.run(
-                ["git", "check-ignore", "-q", relative],
-                cwd=REPO_ROOT,
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertEqual(
-                ignored.returncode,
-                0,
-                msg=f"expected ignored path: {relative}",
-            )
+            relative_paths.append(str(generated.relative_to(REPO_ROOT)))
+        checked = subprocess.run(
+            ["git", "check-ignore", "--stdin"],
+            cwd=REPO_ROOT,
+            input="\n".join(relative_paths) + "\n",
+            text=True,
+            capture_output=True,
+            check=False,
+        )
+        ignored = set(checked.stdout.splitlines())
+        not_ignored = [path for path in relative_paths if path not in ignored]
+        self.assertEqual(not_ignored, [], msg=f"expected ignored paths: {not_ignored}")
 
     def test_integration_demo_smoke_contract_uses_shared_artifact_path(self):
         shell_contents = DEMO_SMOKE_SHELL.read_text(encoding="utf-8")
@@ -86,6 +101,7 @@ class RepoHygieneTests(unittest.TestCase):
         self.assertFalse((REPO_ROOT / ".github" / "scripts" / "__pycache__").exists())
         self.assertFalse((REPO_ROOT / "=").exists())
         self.assertFalse((REPO_ROOT / "]").exists())
+        self.assertFalse(needs_cleanup())
         self.assertIn("cleanup complete", result.stdout)
 
 
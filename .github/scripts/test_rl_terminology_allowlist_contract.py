@@ -1,20 +1,34 @@
+import functools
 import json
 import unittest
 from pathlib import Path
 
+from _contract_checks import assert_regular_file, find_missing_snippets
+from _paths import REPO_ROOT
+
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "rl-terms-allowlist.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "rl-terminology-allowlist.md"
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "rl-terminology-scan.sh"
 DOCS_INDEX_PATH = REPO_ROOT / "docs" / "README.md"
 
 
+@functools.lru_cache(maxsize=None)
+def load_policy() -> dict:
+    return json.loads(POLICY_PATH.read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def read_text(path: Path) -> str:
+    return path.read_text(encoding="utf-8")
+
+
 class RlTerminologyAllowlistContractTests(unittest.TestCase):
     def test_unit_policy_schema_has_required_fields(self):
-        self.assertTrue(POLICY_PATH.is_file())
-        policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+        try:
+            policy = load_policy()
+        except FileNotFoundError:
+            self.fail(f"missing policy: {POLICY_PATH}")
 
         self.assertEqual(policy["schema_version"], 1)
         self.assertEqual(policy["policy_id"], "rl-terms-allowlist")
@@ -29,8 +43,10 @@ class RlTerminologyAllowlistContractTests(unittest.TestCase):
             self.assertIn("rationale", entry)
 
     def test_functional_guide_has_examples_and_non_examples(self):
-        self.assertTrue(GUIDE_PATH.is_file())
-        guide = GUIDE_PATH.read_text(encoding="utf-8")
+        try:
+            guide = read_text(GUIDE_PATH)
+        except FileNotFoundError:
+            self.fail(f"missing guide: {GUIDE_PATH}")
 
         self.assertIn("## Approved Examples", guide)
         self.assertIn("## Non-Examples", guide)
@@ -38,21 +54,23 @@ class RlTerminologyAllowlistContractTests(unittest.TestCase):
         self.assertIn("stale wording", guide)
 
     def test_integration_docs_index_and_script_discoverability(self):
-        self.assertTrue(SCRIPT_PATH.is_file())
-        self.assertTrue(SCRIPT_PATH.stat().st_mode & 0o111)
+        script_stat = assert_regular_file(self, SCRIPT_PATH, "script")
+        self.assertTrue(script_stat.st_mode & 0o111)
 
-        docs_index = DOCS_INDEX_PATH.read_text(encoding="utf-8")
+        docs_index = read_text(DOCS_INDEX_PATH)
         self.assertIn("RL Terminology Allowlist", docs_index)
         self.assertIn("guides/rl-terminology-allowlist.md", docs_index)
 
     def test_regression_policy_examples_align_with_guide(self):
-        policy = json.loads(POLICY_PATH.read_text(encoding="utf-8"))
-        guide = GUIDE_PATH.read_text(encoding="utf-8")
+        policy = load_policy()
+        guide = read_text(GUIDE_PATH)
 
+        required = []
         for entry in policy["approved_terms"]:
-            self.assertIn(entry["term"], guide)
-            for path in entry["allowed_paths"]:
-                self.assertIn(path, guide)
+            required.append(entry["term"])
+            required.extend(entry["allowed_paths"])
+        missing = find_missing_snippets(guide, tuple(dict.fromkeys(required)))
+        self.assertEqual(missing, [], msg=f"policy terms/paths missing from guide: {missing}")
 
 
 if __name__ == "__main__":
@@ -1,67 +1,79 @@
+import functools
 import json
 import unittest
-from pathlib import Path
+
+from _contract_checks import assert_regular_file, find_missing_snippets
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SCRIPT_PATH = REPO_ROOT / "scripts" / "dev" / "roadmap-status-artifact.sh"
 SCHEMA_PATH = REPO_ROOT / "tasks" / "schemas" / "roadmap-status-artifact.schema.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
 WORKFLOW_PATH = REPO_ROOT / ".github" / "workflows" / "roadmap-status-artifacts.yml"
 
+EXPECTED_SCHEMA_REQUIRED = frozenset(
+    {
+        "schema_version",
+        "generated_at",
+        "repository",
+        "source_mode",
+        "summary",
+        "todo_groups",
+        "epics",
+        "gap",
+        "issue_states",
+    }
+)
+
 REQUIRED_GUIDE_SNIPPETS = (
-    "roadmap-status-artifact.sh",
-    "roadmap-status-artifact.schema.json",
-    "roadmap-status-artifacts.yml",
+    b"roadmap-status-artifact.sh",
+    b"roadmap-status-artifact.schema.json",
+    b"roadmap-status-artifacts.yml",
 )
 
 REQUIRED_WORKFLOW_SNIPPETS = (
-    "schedule:",
-    "workflow_dispatch:",
-    "issues: read",
-    "scripts/dev/roadmap-status-artifact.sh",
-    "actions/upload-artifact@v6",
+    b"schedule:",
+    b"workflow_dispatch:",
+    b"issues: read",
+    b"scripts/dev/roadmap-status-artifact.sh",
+    b"actions/upload-artifact@v6",
 )
 
 
-def find_missing_snippets(text: str, required_snippets: tuple[str, ...]) -> list[str]:
-    return [snippet for snippet in required_snippets if snippet not in text]
+@functools.lru_cache(maxsize=None)
+def load_schema() -> dict:
+    return json.loads(SCHEMA_PATH.read_bytes())
 
 
 class RoadmapStatusArtifactContractTests(unittest.TestCase):
     def test_unit_script_and_schema_exist(self):
-        self.assertTrue(SCRIPT_PATH.is_file(), msg=f"missing script: {SCRIPT_PATH}")
-        self.assertTrue(SCRIPT_PATH.stat().st_mode & 0o111)
-        self.assertTrue(SCHEMA_PATH.is_file(), msg=f"missing schema: {SCHEMA_PATH}")
+        script_stat = assert_regular_file(self, SCRIPT_PATH, "script")
+        self.assertTrue(script_stat.st_mode & 0o111)
+        assert_regular_file(self, SCHEMA_PATH, "schema")
 
     def test_functional_schema_has_required_contract_shape(self):
-        schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+        schema = load_schema()
         self.assertEqual(schema["$schema"], "https://json-schema.org/draft/2020-12/schema")
         self.assertEqual(schema["type"], "object")
 
-        required = set(schema["required"])
-        self.assertIn("schema_version", required)
-        self.assertIn("generated_at", required)
-        self.assertIn("repository", required)
-        self.assertIn("source_mode", required)
-        self.assertIn("summary", required)
-        self.assertIn("todo_groups", required)
-        self.assertIn("epics", required)
-        self.assertIn("gap", required)
-        self.assertIn("issue_states", required)
+        missing = EXPECTED_SCHEMA_REQUIRED - frozenset(schema["required"])
+        self.assertEqual(
+            missing,
+            frozenset(),
+            msg=f"schema missing required keys: {sorted(missing)}",
+        )
 
     def test_integration_docs_reference_script_schema_and_workflow(self):
-        guide_text = GUIDE_PATH.read_text(encoding="utf-8")
+        guide_text = GUIDE_PATH.read_bytes()
         missing = find_missing_snippets(guide_text, REQUIRED_GUIDE_SNIPPETS)
         self.assertEqual(missing, [], msg=f"missing guide snippets: {missing}")
 
     def test_regression_workflow_contract_for_scheduled_manual_artifacts(self):
-        workflow_text = WORKFLOW_PATH.read_text(encoding="utf-8")
+        workflow_text = WORKFLOW_PATH.read_bytes()
         missing = find_missing_snippets(workflow_text, REQUIRED_WORKFLOW_SNIPPETS)
         self.assertEqual(missing, [], msg=f"missing workflow snippets: {missing}")
-        self.assertEqual(workflow_text.count("workflow_dispatch:"), 1)
-        self.assertGreaterEqual(workflow_text.count("cron:"), 1)
+        self.assertEqual(workflow_text.count(b"workflow_dispatch:"), 1)
+        self.assertGreaterEqual(workflow_text.count(b"cron:"), 1)
 
 
 if __name__ == "__main__":
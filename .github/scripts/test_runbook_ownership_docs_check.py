@@ -4,14 +4,8 @@ import tempfile
 import unittest
 from pathlib import Path
 
-
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
-
-import runbook_ownership_docs_check  # noqa: E402
-
-
-REPO_ROOT = SCRIPT_DIR.parents[1]
+from _paths import REPO_ROOT, SCRIPT_DIR
+import runbook_ownership_docs_check
 
 
 class RunbookOwnershipDocsCheckTests(unittest.TestCase):
@@ -24,14 +18,14 @@ class RunbookOwnershipDocsCheckTests(unittest.TestCase):
                 "--repo-root",
                 str(REPO_ROOT),
             ],
-            text=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             check=False,
         )
-        self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
+        self.assertEqual(completed.returncode, 0, msg=completed.stdout.decode("utf-8", "replace"))
         expected_checked_docs = len(runbook_ownership_docs_check.OWNERSHIP_SPECS) + 1
-        self.assertIn(f"checked_docs={expected_checked_docs}", completed.stdout)
-        self.assertIn("issues=0", completed.stdout)
+        self.assertIn(f"checked_docs={expected_checked_docs}".encode(), completed.stdout)
+        self.assertIn(b"issues=0", completed.stdout)
 
     def test_integration_collect_ownership_issues_returns_empty_for_repository(self):
         issues = runbook_ownership_docs_check.collect_ownership_issues(REPO_ROOT)
@@ -1,3 +1,5 @@
+import contextlib
+import io
 import json
 import subprocess
 import sys
@@ -5,22 +7,41 @@ import tempfile
 import unittest
 from pathlib import Path
 
+from _paths import REPO_ROOT, SCRIPT_DIR
+import rust_doc_density
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-sys.path.insert(0, str(SCRIPT_DIR))
 
-import rust_doc_density  # noqa: E402
+DEMO_CARGO_TOML = b'[package]\nname = "demo-crate"\nversion = "0.1.0"\nedition = "2021"\n'
 
 
-REPO_ROOT = SCRIPT_DIR.parents[1]
+def run_density_in_process(argv: list[str]) -> tuple[int, str]:
+    stdout = io.StringIO()
+    with contextlib.redirect_stdout(stdout):
+        returncode = rust_doc_density.main(argv)
+    return returncode, stdout.getvalue()
 
 
 class RustDocDensityTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls._temp_root = tempfile.TemporaryDirectory()
+        cls.temp_root = Path(cls._temp_root.name)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls._temp_root.cleanup()
+
+    def make_demo_crate(self, lib_source: bytes) -> Path:
+        root = Path(tempfile.mkdtemp(dir=self.temp_root))
+        crate_dir = root / "crates" / "demo-crate"
+        (crate_dir / "src").mkdir(parents=True)
+        (crate_dir / "Cargo.toml").write_bytes(DEMO_CARGO_TOML)
+        (crate_dir / "src" / "lib.rs").write_bytes(lib_source)
+        return root
+
     def test_unit_extract_public_items_reports_documented_and_missing(self):
-        with tempfile.TemporaryDirectory() as temp_dir:
-            file_path = Path(temp_dir) / "lib.rs"
-            file_path.write_text(
-                """
+        items = rust_doc_density.extract_public_items_from_source(
+            b"""
 /// documented struct
 pub struct Documented;
 
@@ -28,15 +49,17 @@ pub enum Undocumented {
     A,
 }
 """,
-                encoding="utf-8",
-            )
-            items = rust_doc_density.extract_public_items(file_path)
-            self.assertEqual(len(items), 2)
-            self.assertTrue(items[0].documented)
-            self.assertFalse(items[1].documented)
+            Path("lib.rs"),
+        )
+        self.assertEqual(len(items), 2)
+        self.assertTrue(items[0].documented)
+        self.assertFalse(items[1].documented)
 
     def test_functional_cli_reports_success_for_repository_targets(self):
+        # The only full-repository CLI run: check the human report and the
+        # JSON artifact from the same scan.
         script_path = SCRIPT_DIR / "rust_doc_density.py"
+        artifact_path = Path(tempfile.mkdtemp(dir=self.temp_root)) / "rust-doc-density.json"
         completed = subprocess.run(
             [
                 sys.executable,
@@ -45,36 +68,33 @@ pub enum Undocumented {
                 str(REPO_ROOT),
                 "--targets-file",
                 "docs/guides/doc-density-targets.json",
+                "--json-output-file",
+                str(artifact_path),
             ],
-            text=True,
-            capture_output=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
             check=False,
         )
-        self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
-        self.assertIn("rust doc density check", completed.stdout)
-        self.assertIn("issues=0", completed.stdout)
+        self.assertEqual(completed.returncode, 0, msg=completed.stdout.decode("utf-8", "replace"))
+        self.assertIn(b"rust doc density check", completed.stdout)
+        self.assertIn(b"issues=0", completed.stdout)
+        payload = json.loads(artifact_path.read_bytes())
+        self.assertEqual(payload["schema_version"], 1)
+        self.assertIsInstance(payload["reports"], list)
+        self.assertGreater(len(payload["reports"]), 0)
 
     def test_functional_cli_json_includes_schema_version(self):
-        script_path = SCRIPT_DIR / "rust_doc_density.py"
-        completed = subprocess.run(
-            [
-                sys.executable,
-                str(script_path),
-                "--repo-root",
-                str(REPO_ROOT),
-                "--targets-file",
-                "docs/guides/doc-density-targets.json",
-                "--json",
-            ],
-            text=True,
-            capture_output=True,
-            check=False,
-        )
-        self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
-        payload = json.loads(completed.stdout)
+        # --json stdout and --json-output-file share build_json_payload, and the
+        # repository-wide run above checks the file, so a fixture crate suffices here.
+        root = self.make_demo_crate(b"/// documented\npub fn documented() {}\npub fn undoc() {}\n")
+        returncode, stdout = run_density_in_process(["--repo-root", str(root), "--json"])
+        self.assertEqual(returncode, 0, msg=stdout)
+        payload = json.loads(stdout)
         self.assertEqual(payload["schema_version"], 1)
         self.assertIn("reports", payload)
         self.assertIsInstance(payload["reports"], list)
+        self.assertEqual(payload["reports"][0]["crate"], "demo-crate")
+        self.assertEqual(payload["reports"][0]["documented_public_items"], 1)
 
     def test_integration_density_reports_include_anchor_crates(self):
         reports, items = rust_doc_density.compute_density_reports(REPO_ROOT, "crates")
@@ -86,78 +106,36 @@ pub enum Undocumented {
         self.assertGreater(len(items), 0)
 
     def test_regression_cli_fails_when_crate_target_not_met(self):
-        script_path = SCRIPT_DIR / "rust_doc_density.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            src_dir = root / "crates" / "demo-crate" / "src"
-            src_dir.mkdir(parents=True, exist_ok=True)
-            (root / "crates" / "demo-crate" / "Cargo.toml").write_text(
-                "[package]\nname = \"demo-crate\"\nversion = \"0.1.0\"\nedition = \"2021\"\n",
-                encoding="utf-8",
-            )
-            (src_dir / "lib.rs").write_text("pub fn undoc() {}\n", encoding="utf-8")
-            targets_path = root / "targets.json"
-            targets_path.write_text(
-                json.dumps(
-                    {
-                        "crate_min_percent": {
-                            "demo-crate": 100.0,
-                        }
-                    }
-                ),
-                encoding="utf-8",
-            )
-
-            completed = subprocess.run(
-                [
-                    sys.executable,
-                    str(script_path),
-                    "--repo-root",
-                    str(root),
-                    "--targets-file",
-                    str(targets_path.relative_to(root)),
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertNotEqual(completed.returncode, 0)
-            self.assertIn("crate_min_failed", completed.stdout)
+        root = self.make_demo_crate(b"pub fn undoc() {}\n")
+        targets_path = root / "targets.json"
+        targets_path.write_bytes(b'{"crate_min_percent": {"demo-crate": 100.0}}')
+
+        returncode, stdout = run_density_in_process(
+            [
+                "--repo-root",
+                str(root),
+                "--targets-file",
+                str(targets_path.relative_to(root)),
+            ]
+        )
+        self.assertNotEqual(returncode, 0)
+        self.assertIn("crate_min_failed", stdout)
 
     def test_regression_json_output_file_writes_per_crate_artifact(self):
-        script_path = SCRIPT_DIR / "rust_doc_density.py"
-        with tempfile.TemporaryDirectory() as temp_dir:
-            root = Path(temp_dir)
-            src_dir = root / "crates" / "demo-crate" / "src"
-            src_dir.mkdir(parents=True, exist_ok=True)
-            (root / "crates" / "demo-crate" / "Cargo.toml").write_text(
-                "[package]\nname = \"demo-crate\"\nversion = \"0.1.0\"\nedition = \"2021\"\n",
-                encoding="utf-8",
-            )
-            (src_dir / "lib.rs").write_text("/// documented\npub fn documented() {}\n", encoding="utf-8")
-
-            artifact_rel = Path("ci-artifacts/rust-doc-density.json")
-            artifact_path = root / artifact_rel
-            completed = subprocess.run(
-                [
-                    sys.executable,
-                    str(script_path),
-                    "--repo-root",
-                    str(root),
-                    "--json-output-file",
-                    str(artifact_rel),
-                ],
-                text=True,
-                capture_output=True,
-                check=False,
-            )
-            self.assertEqual(completed.returncode, 0, msg=completed.stdout + completed.stderr)
-            self.assertTrue(artifact_path.is_file())
-
-            payload = json.loads(artifact_path.read_text(encoding="utf-8"))
-            self.assertEqual(payload["schema_version"], 1)
-            self.assertEqual(payload["crate_count"], 1)
-            self.assertEqual(payload["reports"][0]["crate"], "demo-crate")
+        root = self.make_demo_crate(b"/// documented\npub fn documented() {}\n")
+
+        artifact_rel = Path("ci-artifacts/rust-doc-density.json")
+        artifact_path = root / artifact_rel
+        returncode, stdout = run_density_in_process(
+            ["--repo-root", str(root), "--json-output-file", str(artifact_rel)]
+        )
+        self.assertEqual(returncode, 0, msg=stdout)
+        self.assertTrue(artifact_path.is_file())
+
+        payload = json.loads(artifact_path.read_bytes())
+        self.assertEqual(payload["schema_version"], 1)
+        self.assertEqual(payload["crate_count"], 1)
+        self.assertEqual(payload["reports"][0]["crate"], "demo-crate")
 
 
 if __name__ == "__main__":
@@ -1,17 +1,27 @@
+import collections
+import functools
 import json
 import unittest
 from pathlib import Path
 
+from _contract_checks import find_missing_snippets
+from _paths import REPO_ROOT
+
 
-REPO_ROOT = Path(__file__).resolve().parents[2]
 POLICY_PATH = REPO_ROOT / "tasks" / "policies" / "stale-branch-alert-policy.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "stale-branch-response-playbook.md"
 SYNC_GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "roadmap-status-sync.md"
 PR_TEMPLATE_PATH = REPO_ROOT / ".github" / "pull_request_template.md"
 
 
+@functools.lru_cache(maxsize=None)
 def load_policy() -> dict:
-    return json.loads(POLICY_PATH.read_text(encoding="utf-8"))
+    return json.loads(POLICY_PATH.read_bytes())
+
+
+@functools.lru_cache(maxsize=None)
+def read_bytes(path: Path) -> bytes:
+    return path.read_bytes()
 
 
 class StaleBranchAlertPolicyTests(unittest.TestCase):
@@ -39,57 +49,77 @@ class StaleBranchAlertPolicyTests(unittest.TestCase):
     def test_regression_alert_condition_ids_are_unique_and_actionable(self):
         policy = load_policy()
         conditions = policy["alert_conditions"]
-        condition_ids = [entry["id"] for entry in conditions]
+        id_counts: collections.Counter[str] = collections.Counter()
 
-        self.assertEqual(len(condition_ids), len(set(condition_ids)))
         self.assertGreaterEqual(len(conditions), 3)
         for entry in conditions:
+            id_counts[entry["id"]] += 1
             self.assertIn(entry["severity"], {"warning", "error"})
             self.assertGreater(len(entry["channels"]), 0)
+        duplicates = [condition_id for condition_id, count in id_counts.items() if count > 1]
+        self.assertEqual(duplicates, [], msg=f"duplicate alert condition ids: {duplicates}")
 
     def test_integration_docs_and_template_reference_policy_contract(self):
         policy = load_policy()
-        guide_text = GUIDE_PATH.read_text(encoding="utf-8")
-        sync_text = SYNC_GUIDE_PATH.read_text(encoding="utf-8")
-        template_text = PR_TEMPLATE_PATH.read_text(encoding="utf-8")
-
-        self.assertIn("stale-branch-alert-policy.json", guide_text)
-        self.assertIn("stale-branch-alert-policy.json", sync_text)
-
-        for condition in policy["alert_conditions"]:
-            self.assertIn(condition["id"], guide_text)
-
-        for field in policy["acknowledge_resolve_workflow"]["required_ack_fields"]:
-            self.assertIn(field, guide_text)
-
-        for field in policy["pr_reference_fields"]:
-            self.assertIn(field, guide_text)
-            self.assertIn(field, template_text)
-
-        normalized_guide = guide_text.replace("`", "").lower()
-        self.assertIn("conflict triage flow", normalized_guide)
-        self.assertIn("merge", normalized_guide)
-        self.assertIn("rebase", normalized_guide)
-        self.assertIn("abandon", normalized_guide)
-
-        for trigger in policy["rollback_triggers"]:
-            self.assertIn(trigger["id"], guide_text)
+        guide_text = read_bytes(GUIDE_PATH)
+        sync_text = read_bytes(SYNC_GUIDE_PATH)
+        template_text = read_bytes(PR_TEMPLATE_PATH)
+
+        self.assertIn(b"stale-branch-alert-policy.json", guide_text)
+        self.assertIn(b"stale-branch-alert-policy.json", sync_text)
+
+        pr_reference_fields = tuple(field.encode() for field in policy["pr_reference_fields"])
+        guide_required = tuple(
+            value.encode()
+            for value in [condition["id"] for condition in policy["alert_conditions"]]
+            + policy["acknowledge_resolve_workflow"]["required_ack_fields"]
+            + policy["pr_reference_fields"]
+            + [trigger["id"] for trigger in policy["rollback_triggers"]]
+        )
+        missing_in_guide = find_missing_snippets(guide_text, guide_required)
+        self.assertEqual(
+            missing_in_guide,
+            [],
+            msg=f"playbook missing policy ids: {[value.decode() for value in missing_in_guide]}",
+        )
+        missing_in_template = find_missing_snippets(template_text, pr_reference_fields)
+        self.assertEqual(
+            missing_in_template,
+            [],
+            msg=f"PR template missing reference fields: "
+            f"{[field.decode() for field in missing_in_template]}",
+        )
+
+        normalized_guide = guide_text.replace(b"`", b"").lower()
+        self.assertIn(b"conflict triage flow", normalized_guide)
+        self.assertIn(b"merge", normalized_guide)
+        self.assertIn(b"rebase", normalized_guide)
+        self.assertIn(b"abandon", normalized_guide)
 
     def test_regression_resolve_states_are_documented_in_playbook(self):
         policy = load_policy()
-        guide_text = GUIDE_PATH.read_text(encoding="utf-8")
-        for state in policy["acknowledge_resolve_workflow"]["resolve_states"]:
-            self.assertIn(state, guide_text)
+        guide_text = read_bytes(GUIDE_PATH)
+        resolve_states = tuple(
+            state.encode() for state in policy["acknowledge_resolve_workflow"]["resolve_states"]
+        )
+        missing = find_missing_snippets(guide_text, resolve_states)
+        self.assertEqual(
+            missing,
+            [],
+            msg=f"playbook missing resolve states: {[state.decode() for state in missing]}",
+        )
 
     def test_regression_rollback_trigger_ids_are_unique_with_actions(self):
         policy = load_policy()
         triggers = policy["rollback_triggers"]
-        trigger_ids = [entry["id"] for entry in triggers]
+        id_counts: collections.Counter[str] = collections.Counter()
 
-        self.assertEqual(len(trigger_ids), len(set(trigger_ids)))
         self.assertGreaterEqual(len(triggers), 2)
         for entry in triggers:
+            id_counts[entry["id"]] += 1
             self.assertGreater(len(entry["required_actions"]), 0)
+        duplicates = [trigger_id for trigger_id, count in id_counts.items() if count > 1]
+        self.assertEqual(duplicates, [], msg=f"duplicate rollback trigger ids: {duplicates}")
 
 
 if __name__ == "__main__":
@@ -1,10 +1,10 @@
 import json
 import unittest
-from pathlib import Path
+
+from _contract_checks import find_missing_snippets
+from _paths import REPO_ROOT
 
 
-SCRIPT_DIR = Path(__file__).resolve().parent
-REPO_ROOT = SCRIPT_DIR.parents[1]
 SPLIT_MAP_SCRIPT = REPO_ROOT / "scripts" / "dev" / "tools-split-map.sh"
 SCHEMA_PATH = REPO_ROOT / "tasks" / "schemas" / "m25-tools-split-map.schema.json"
 GUIDE_PATH = REPO_ROOT / "docs" / "guides" / "tools-split-map.md"
@@ -31,7 +31,7 @@ class ToolsSplitMapContractTests(unittest.TestCase):
         self.assertTrue(REPORT_MD_PATH.is_file(), msg=f"missing report md: {REPORT_MD_PATH}")
 
     def test_functional_schema_contract_contains_required_fields(self):
-        schema = json.loads(SCHEMA_PATH.read_text(encoding="utf-8"))
+        schema = json.loads(SCHEMA_PATH.read_bytes())
         self.assertEqual(schema["$schema"], "https://json-schema.org/draft/2020-12/schema")
         required = set(schema["required"])
         self.assertIn("schema_version", required)
@@ -46,11 +46,11 @@ class ToolsSplitMapContractTests(unittest.TestCase):
 
     def test_integration_guide_references_split_map_contract_artifacts(self):
         guide_text = GUIDE_PATH.read_text(encoding="utf-8")
-        missing = [snippet for snippet in REQUIRED_GUIDE_SNIPPETS if snippet not in guide_text]
+        missing = find_missing_snippets(guide_text, REQUIRED_GUIDE_SNIPPETS)
         self.assertEqual(missing, [], msg=f"missing guide snippets: {missing}")
 
     def test_regression_report_matches_schema_version_and_target_budget(self):
-        payload = json.loads(REPORT_JSON_PATH.read_text(encoding="utf-8"))
+        payload = json.loads(REPORT_JSON_PATH.read_bytes())
         self.assertEqual(payload["schema_version"], 1)
         self.assertEqual(payload["source_file"], "crates/tau-tools/src/tools.rs")
         self.assertEqual(payload["target_line_budget"], 3000)
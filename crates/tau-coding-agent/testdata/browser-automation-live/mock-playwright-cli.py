@@ -1,43 +1,34 @@
 #!/usr/bin/env python3
-import json
 import sys
 
 
-def main() -> int:
-    command = sys.argv[1] if len(sys.argv) > 1 else ""
+# Constant responses are pre-encoded literals so the session commands never import json.
+SESSION_OK_RESPONSE = '{"status": "ok"}\n'
+SNAPSHOT_RESPONSE = (
+    '{"status_code": 200, "response_body": {"status": "ok", "operation": "snapshot", '
+    '"snapshot_id": "snapshot-live", '
+    '"elements": [{"id": "e1", "role": "button", "name": "Run"}]}}\n'
+)
+INVALID_OPERATION_RESPONSE = (
+    '{"status_code": 400, "error_code": "browser_automation_invalid_operation", '
+    '"response_body": {"status": "rejected", "reason": "invalid_operation"}}\n'
+)
 
-    if command == "start-session":
-        print(json.dumps({"status": "ok"}))
-        return 0
 
-    if command == "shutdown-session":
-        print(json.dumps({"status": "ok"}))
-        return 0
+def handle_session(_argv: list[str]) -> int:
+    sys.stdout.write(SESSION_OK_RESPONSE)
+    return 0
 
-    if command != "execute-action":
-        print("unsupported command", file=sys.stderr)
-        return 2
 
-    payload = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+def handle_execute_action(argv: list[str]) -> int:
+    import json
+
+    payload = json.loads(argv[0]) if argv else {}
     operation = str(payload.get("operation", "")).strip().lower()
 
     if operation == "snapshot":
-        print(
-            json.dumps(
-                {
-                    "status_code": 200,
-                    "response_body": {
-                        "status": "ok",
-                        "operation": "snapshot",
-                        "snapshot_id": "snapshot-live",
-                        "elements": [{"id": "e1", "role": "button", "name": "Run"}],
-                    },
-                }
-            )
-        )
-        return 0
-
-    if operation == "action":
+        sys.stdout.write(SNAPSHOT_RESPONSE)
+    elif operation == "action":
         print(
             json.dumps(
                 {
@@ -54,19 +45,26 @@ def main() -> int:
                 }
             )
         )
-        return 0
-
-    print(
-        json.dumps(
-            {
-                "status_code": 400,
-                "error_code": "browser_automation_invalid_operation",
-                "response_body": {"status": "rejected", "reason": "invalid_operation"},
-            }
-        )
-    )
+    else:
+        sys.stdout.write(INVALID_OPERATION_RESPONSE)
     return 0
 
 
+COMMAND_HANDLERS = {
+    "start-session": handle_session,
+    "shutdown-session": handle_session,
+    "execute-action": handle_execute_action,
+}
+
+
+def main() -> int:
+    command = sys.argv[1] if len(sys.argv) > 1 else ""
+    handler = COMMAND_HANDLERS.get(command)
+    if handler is None:
+        print("unsupported command", file=sys.stderr)
+        return 2
+    return handler(sys.argv[2:])
+
+
 if __name__ == "__main__":
     raise SystemExit(main())
@@ -147,10 +147,10 @@ if [[ -n "${FIXTURE_ISSUES_JSON}" && ! -f "${FIXTURE_ISSUES_JSON}" ]]; then
 fi
 
 require_cmd python3
-require_cmd jq
 
 if [[ -z "${FIXTURE_ISSUES_JSON}" ]]; then
   require_cmd gh
+  require_cmd jq
 fi
 
 mkdir -p "$(dirname "${OUTPUT_JSON}")"
@@ -159,10 +159,10 @@ mkdir -p "$(dirname "${OUTPUT_MD}")"
 tmp_dir="$(mktemp -d)"
 trap 'rm -rf "${tmp_dir}"' EXIT
 
-issues_input="${tmp_dir}/issues-input.json"
+issue_inputs=()
 
 if [[ -n "${FIXTURE_ISSUES_JSON}" ]]; then
-  cp "${FIXTURE_ISSUES_JSON}" "${issues_input}"
+  issue_inputs+=("${FIXTURE_ISSUES_JSON}")
   SOURCE_MODE="fixture"
   if [[ -z "${REPO_SLUG}" ]]; then
     REPO_SLUG="fixture/repository"
@@ -173,7 +173,8 @@ else
     REPO_SLUG="$(gh repo view --json nameWithOwner --jq '.nameWithOwner')"
   fi
 
-  echo '[]' >"${issues_input}"
+  # Keep each page as its own file; the graph builder below merges them in a
+  # single parse instead of re-reading the accumulated list for every page.
   page=1
   while true; do
     endpoint="repos/${REPO_SLUG}/issues?state=${ISSUE_STATE}&labels=${LABEL_FILTER}&per_page=100&page=${page}"
@@ -187,9 +188,7 @@ else
     if [[ "${page_count}" -eq 0 ]]; then
       break
     fi
-
-    jq -s '.[0] + .[1]' "${issues_input}" "${page_payload}" >"${issues_input}.next"
-    mv "${issues_input}.next" "${issues_input}"
+    issue_inputs+=("${page_payload}")
 
     if [[ "${page_count}" -lt 100 ]]; then
       break
@@ -199,18 +198,17 @@ else
 
   root_payload="${tmp_dir}/root-issue.json"
   gh_api_with_retry "repos/${REPO_SLUG}/issues/${ROOT_ISSUE}" "${root_payload}"
-  jq -s '.[0] + [.[1]]' "${issues_input}" "${root_payload}" >"${issues_input}.next"
-  mv "${issues_input}.next" "${issues_input}"
+  issue_inputs+=("${root_payload}")
 fi
 
 python3 - \
-  "${issues_input}" \
   "${OUTPUT_JSON}" \
   "${OUTPUT_MD}" \
   "${ROOT_ISSUE}" \
   "${REPO_SLUG}" \
   "${SOURCE_MODE}" \
-  "${QUIET_MODE}" <<'PY'
+  "${QUIET_MODE}" \
+  "${issue_inputs[@]}" <<'PY'
 from __future__ import annotations
 
 import json
@@ -222,13 +220,13 @@ from pathlib import Path
 from typing import Any
 
 (
-    issues_input_path,
     output_json_path,
     output_md_path,
     root_issue_raw,
     repository,
     source_mode,
     quiet_mode,
+    *issues_input_paths,
 ) = sys.argv[1:]
 
 root_issue = int(root_issue_raw)
@@ -248,6 +246,8 @@ def load_issues(path: str) -> list[dict[str, Any]]:
         issues = payload.get("issues")
         if isinstance(issues, list):
             return [entry for entry in issues if isinstance(entry, dict)]
+        if source_mode == "live" and isinstance(payload.get("number"), int):
+            return [payload]
     raise SystemExit("error: issues input must decode to a JSON array")
 
 
@@ -316,7 +316,7 @@ def normalize_issue(raw: dict[str, Any]) -> dict[str, Any] | None:
     }
 
 
-raw_issues = load_issues(issues_input_path)
+raw_issues = [issue for path in issues_input_paths for issue in load_issues(path)]
 
 nodes_by_number: dict[int, dict[str, Any]] = {}
 for raw in raw_issues: